@@ -6,12 +6,14 @@ import time
 
 # Added: 2025-05-16T09:25:12-04:00 - Import database initialization module
 from .db.init_db import init_db
+# Added: 2026-10-16 - Read EMPROPS_DEBUG_LOGGING once instead of on every log call
+from .nodes.helpers.log_helper import DEBUG_LOGGING
 
 # Added: 2025-04-20T19:47:26-04:00 - Enhanced logging for debugging
 def log_debug(message):
     """Enhanced logging function with timestamp and stack info"""
     # Updated: 2025-05-22T20:06:19-04:00 - Added environment variable control for debug logging
-    if os.environ.get('EMPROPS_DEBUG_LOGGING', '').lower() in ('1', 'true', 'yes', 'on'):
+    if DEBUG_LOGGING:
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         caller = traceback.extract_stack()[-2]
         file = os.path.basename(caller.filename)
@@ -27,7 +29,8 @@ def log_debug(message):
 from .nodes.emprops_lora_loader_simple import EmProps_Lora_Loader_Simple
 from .nodes.emprops_cloud_storage_saver import EmpropsCloudStorageSaver
 from .nodes.emprops_image_loader import EmpropsImageLoader
-from .nodes.emprops_text_s3_saver import EmProps_Text_S3_Saver
+# Updated: 2026-10-16 - The legacy emprops_text_s3_saver module is no longer imported; its class was
+# shadowed by the cloud storage saver's EmProps_Text_S3_Saver below and never registered
 from .nodes.emprops_text_cloud_storage_saver import EmpropsTextCloudStorageSaver, EmProps_Text_S3_Saver as EmProps_Text_S3_Saver_New  # Added: 2025-04-24T15:20:02-04:00
 from .nodes.emprops_asset_downloader import EmProps_Asset_Downloader  # Added: 2025-05-12T13:52:12-04:00
 from .nodes.emprops_checkpoint_loader import EmProps_Checkpoint_Loader  # Added: 2025-05-13T09:42:00-04:00
@@ -60,34 +63,37 @@ except Exception as e:
 log_debug("Loading EmProps nodes")
 log_debug(f"Current directory: {os.path.dirname(os.path.abspath(__file__))}")
 
-# Log all available modules
-log_debug(f"Available modules in sys.modules: {[m for m in sys.modules.keys() if 'emprops' in m.lower()]}")
+# Updated: 2026-10-16 - Startup introspection only runs with EMPROPS_DEBUG_LOGGING set; it
+# called INPUT_TYPES() and formatted dir()/sys.modules on every import even when nothing was printed
+if DEBUG_LOGGING:
+    # Log all available modules
+    log_debug(f"Available modules in sys.modules: {[m for m in sys.modules.keys() if 'emprops' in m.lower()]}")
 
-# Debug: Print node class details
-# Updated: 2025-04-20T19:47:26-04:00 - Enhanced logging for debugging
-try:
-    for name in ['EmProps_Lora_Loader', 'EmpropsCloudStorageSaver', 'EmpropsImageLoader', 'EmpropsModelDownloader']:
-        try:
-            cls = globals()[name]
-            log_debug(f"Node class {name} found in globals()")
-            log_debug(f"  - Type: {type(cls)}")
-            log_debug(f"  - Dir: {dir(cls)}")
-            log_debug(f"  - RETURN_TYPES: {getattr(cls, 'RETURN_TYPES', None)}")
-            log_debug(f"  - INPUT_TYPES: {getattr(cls, 'INPUT_TYPES', None) if hasattr(cls, 'INPUT_TYPES') else 'No INPUT_TYPES'}")
+    # Debug: Print node class details
+    # Updated: 2025-04-20T19:47:26-04:00 - Enhanced logging for debugging
+    try:
+        for name in ['EmProps_Lora_Loader', 'EmpropsCloudStorageSaver', 'EmpropsImageLoader', 'EmpropsModelDownloader']:
+            try:
+                cls = globals()[name]
+                log_debug(f"Node class {name} found in globals()")
+                log_debug(f"  - Type: {type(cls)}")
+                log_debug(f"  - Dir: {dir(cls)}")
+                log_debug(f"  - RETURN_TYPES: {getattr(cls, 'RETURN_TYPES', None)}")
+                log_debug(f"  - INPUT_TYPES: {getattr(cls, 'INPUT_TYPES', None) if hasattr(cls, 'INPUT_TYPES') else 'No INPUT_TYPES'}")
             
-            # Check if the class has the required methods
-            if hasattr(cls, 'INPUT_TYPES') and callable(getattr(cls, 'INPUT_TYPES')):
-                try:
-                    input_types = cls.INPUT_TYPES()
-                    log_debug(f"  - INPUT_TYPES() result: {input_types}")
-                except Exception as e:
-                    log_debug(f"  - ERROR calling INPUT_TYPES(): {str(e)}\n{traceback.format_exc()}")
-        except KeyError:
-            log_debug(f"Node class {name} NOT found in globals()")
-        except Exception as e:
-            log_debug(f"Error inspecting {name}: {str(e)}\n{traceback.format_exc()}")
-except Exception as e:
-    log_debug(f"Error in debug loop: {str(e)}\n{traceback.format_exc()}")
+                # Check if the class has the required methods
+                if hasattr(cls, 'INPUT_TYPES') and callable(getattr(cls, 'INPUT_TYPES')):
+                    try:
+                        input_types = cls.INPUT_TYPES()
+                        log_debug(f"  - INPUT_TYPES() result: {input_types}")
+                    except Exception as e:
+                        log_debug(f"  - ERROR calling INPUT_TYPES(): {str(e)}\n{traceback.format_exc()}")
+            except KeyError:
+                log_debug(f"Node class {name} NOT found in globals()")
+            except Exception as e:
+                log_debug(f"Error inspecting {name}: {str(e)}\n{traceback.format_exc()}")
+    except Exception as e:
+        log_debug(f"Error in debug loop: {str(e)}\n{traceback.format_exc()}")
 
 # Updated: 2025-04-20T19:47:26-04:00 - Added enhanced logging
 log_debug("Creating NODE_CLASS_MAPPINGS dictionary")
@@ -115,8 +121,9 @@ try:
     "EmProps_Cloud_Animated_WEBP_Saver": EmpropsCloudAnimatedWebpSaver,  # Added: 2025-01-30T10:00:00-08:00
 }
     log_debug(f"NODE_CLASS_MAPPINGS created successfully with {len(NODE_CLASS_MAPPINGS)} entries")
-    for node_name, node_class in NODE_CLASS_MAPPINGS.items():
-        log_debug(f"Registered node: {node_name} -> {node_class.__name__ if hasattr(node_class, '__name__') else str(node_class)}")
+    if DEBUG_LOGGING:
+        for node_name, node_class in NODE_CLASS_MAPPINGS.items():
+            log_debug(f"Registered node: {node_name} -> {node_class.__name__ if hasattr(node_class, '__name__') else str(node_class)}")
 except Exception as e:
     log_debug(f"Error creating NODE_CLASS_MAPPINGS: {str(e)}\n{traceback.format_exc()}")
 
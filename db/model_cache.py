@@ -5,6 +5,7 @@ import traceback
 import shutil
 from datetime import datetime
 import threading
+import queue
 
 # Added: 2025-05-13T17:10:27-04:00 - Model cache database implementation
 
@@ -111,59 +112,28 @@ class ModelCacheDB:
         Args:
             path (str): Full path to the model file
         
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.update_model_usages([path])
+    
+    # Added: 2026-10-16 - Batch form used by the background usage queue; one connection and
+    # one commit for every path that arrived together
+    def update_model_usages(self, paths):
+        """
+        Update usage for several models in a single transaction
+        
+        Args:
+            paths (list): Full paths to the model files
+        
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            log_debug(f"Updating model usage: {path}")
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
-            
-            current_time = datetime.now().isoformat()
-            
-            # Get current use count and is_ignore status for logging
-            cursor.execute('SELECT use_count, is_ignore FROM models WHERE path = ?', (path,))
-            row = cursor.fetchone()
-            old_count = row[0] if row and len(row) > 0 else 0
-            is_ignore = row[1] if row and len(row) > 1 else 0
-            
-            # Update the model usage
-            cursor.execute('''
-            UPDATE models 
-            SET last_used = ?, use_count = use_count + 1
-            WHERE path = ?
-            ''', (current_time, path))
-            
-            # If rows were affected, log the update
-            if cursor.rowcount > 0:
-                log_debug(f"Updated model usage in database: {path}")
-                log_debug(f"Incremented use_count from {old_count} to {old_count + 1}")
-                log_debug(f"Updated last_used timestamp to {current_time}")
-                log_debug(f"Model is_ignore status: {bool(is_ignore)}")
-            
-            # If no rows were affected, the model doesn't exist in the database
-            else:
-                # Try to get the file size
-                size_bytes = 0
-                if os.path.exists(path):
-                    size_bytes = os.path.getsize(path)
-                
-                # Get the model type from the path
-                model_type = "unknown"
-                path_parts = path.split(os.sep)
-                if "models" in path_parts:
-                    models_index = path_parts.index("models")
-                    if models_index + 1 < len(path_parts):
-                        model_type = path_parts[models_index + 1]
-                
-                # Insert the model with is_ignore=False (since it's a newly discovered model)
-                filename = os.path.basename(path)
-                cursor.execute('''
-                INSERT INTO models (path, model_type, filename, size_bytes, last_used, use_count, download_date, protected, is_ignore)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (path, model_type, filename, size_bytes, current_time, 1, current_time, 0, 0))
-                log_debug(f"Added missing model to database: {path} (is_ignore=False)")
-            
+            for path in paths:
+                self._apply_model_usage(cursor, path)
             conn.commit()
             conn.close()
             return True
@@ -172,6 +142,54 @@ class ModelCacheDB:
             log_debug(traceback.format_exc())
             return False
     
+    def _apply_model_usage(self, cursor, path):
+        """Record one use of a model on an open cursor, inserting it if it is missing"""
+        log_debug(f"Updating model usage: {path}")
+        current_time = datetime.now().isoformat()
+        
+        # Get current use count and is_ignore status for logging
+        cursor.execute('SELECT use_count, is_ignore FROM models WHERE path = ?', (path,))
+        row = cursor.fetchone()
+        old_count = row[0] if row and len(row) > 0 else 0
+        is_ignore = row[1] if row and len(row) > 1 else 0
+        
+        # Update the model usage
+        cursor.execute('''
+        UPDATE models 
+        SET last_used = ?, use_count = use_count + 1
+        WHERE path = ?
+        ''', (current_time, path))
+        
+        # If rows were affected, log the update
+        if cursor.rowcount > 0:
+            log_debug(f"Updated model usage in database: {path}")
+            log_debug(f"Incremented use_count from {old_count} to {old_count + 1}")
+            log_debug(f"Updated last_used timestamp to {current_time}")
+            log_debug(f"Model is_ignore status: {bool(is_ignore)}")
+        
+        # If no rows were affected, the model doesn't exist in the database
+        else:
+            # Try to get the file size
+            size_bytes = 0
+            if os.path.exists(path):
+                size_bytes = os.path.getsize(path)
+            
+            # Get the model type from the path
+            model_type = "unknown"
+            path_parts = path.split(os.sep)
+            if "models" in path_parts:
+                models_index = path_parts.index("models")
+                if models_index + 1 < len(path_parts):
+                    model_type = path_parts[models_index + 1]
+            
+            # Insert the model with is_ignore=False (since it's a newly discovered model)
+            filename = os.path.basename(path)
+            cursor.execute('''
+            INSERT INTO models (path, model_type, filename, size_bytes, last_used, use_count, download_date, protected, is_ignore)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (path, model_type, filename, size_bytes, current_time, 1, current_time, 0, 0))
+            log_debug(f"Added missing model to database: {path} (is_ignore=False)")
+    
     def get_model_info(self, path):
         """
         Get information about a model
@@ -431,3 +449,46 @@ class ModelCacheDB:
 
 # Create a singleton instance
 model_cache_db = ModelCacheDB()
+
+# Added: 2026-10-16 - Usage updates are written by a daemon thread so callers don't wait on
+# SQLite (and its fsync); updates that arrive within 100ms share one transaction
+_usage_queue = queue.SimpleQueue()
+_usage_thread = None
+_usage_thread_lock = threading.Lock()
+
+# Fixed: 2026-10-16 - Cap each batch so a steady stream of updates can't postpone the write
+_USAGE_BATCH_MAX_ITEMS = 256
+_USAGE_BATCH_MAX_SECONDS = 1.0
+
+def _collect_usage_batch():
+    """Block for one update, then gather more until idle for 100ms or a batch cap is hit"""
+    paths = [_usage_queue.get()[0]]
+    deadline = time.monotonic() + _USAGE_BATCH_MAX_SECONDS
+    try:
+        while len(paths) < _USAGE_BATCH_MAX_ITEMS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            paths.append(_usage_queue.get(timeout=min(0.1, remaining))[0])
+    except queue.Empty:
+        pass
+    return paths
+
+def _drain_usage():
+    while True:
+        model_cache_db.update_model_usages(_collect_usage_batch())
+
+def queue_model_usage(path):
+    """
+    Record a model use without blocking on the database
+    
+    Args:
+        path (str): Full path to the model file
+    """
+    global _usage_thread
+    if _usage_thread is None:
+        with _usage_thread_lock:
+            if _usage_thread is None:
+                _usage_thread = threading.Thread(target=_drain_usage, name="emprops-model-usage", daemon=True)
+                _usage_thread.start()
+    _usage_queue.put_nowait((path,))
@@ -4,7 +4,7 @@ import json
 import time
 import math
 import shutil
-import requests
+import threading
 import traceback
 from pathlib import Path
 from tqdm import tqdm
@@ -12,7 +12,9 @@ from dotenv import load_dotenv
 from server import PromptServer
 import folder_paths  # Updated: 2025-05-12T14:04:35-04:00 - Use folder_paths module instead of direct import
 from typing import Dict, List, Optional, TypedDict
-from ..db.model_cache import model_cache_db
+from ..db.model_cache import model_cache_db, queue_model_usage
+from ..utils import get_http_session
+from .helpers.download_helper import download_ranged, DEFAULT_CHUNK_SIZE
 
 # Load environment variables from .env file in the node's root directory
 node_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -52,6 +54,12 @@ def log_debug(message):
     line = caller.lineno
     print(f"[EmProps DEBUG {timestamp}] [{file}:{line}] {message}", flush=True)
 
+# Added: 2026-10-16 - Large downloads from servers that accept byte ranges are split across
+# several connections; a single TCP stream rarely saturates the link to HF/CivitAI CDNs
+_RANGED_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+_RANGED_DOWNLOAD_PARTS = 8
+_DOWNLOAD_CHUNK_SIZE = DEFAULT_CHUNK_SIZE
+
 def get_token_provider_options() -> List[str]:
     """Get token provider options for the dropdown."""
     # Flag: 2025-06-04 17:19 - Fixed token provider options to return list of strings
@@ -332,10 +340,9 @@ class EmProps_Asset_Downloader:
                 log_debug(f"EmProps_Asset_Downloader: Successfully copied file to {save_path}")
                 
                 # Refresh model cache
-                log_debug(f"Refreshing model cache for {save_to}")
-                if save_to in folder_paths.filename_list_cache:
-                    del folder_paths.filename_list_cache[save_to]
-                folder_paths.get_filename_list(save_to)
+                # Updated: 2026-10-16 - Only invalidate this folder; the next lookup rebuilds it lazily
+                log_debug(f"Invalidating model cache for {save_to}")
+                folder_paths.filename_list_cache.pop(save_to, None)
                 
                 # Return both values
                 log_debug(f"EmProps_Asset_Downloader: Returning filename: {filename}")
@@ -381,9 +388,9 @@ class EmProps_Asset_Downloader:
                     log_debug(f"Last used: {model_info['last_used']}")
                     
                     # Update existing model usage
-                    log_debug(f"Updating usage for existing model...")
-                    model_cache_db.update_model_usage(save_path)
-                    log_debug(f"Successfully updated usage for existing model in cache database")
+                    # Updated: 2026-10-16 - Queued; written by the cache DB's background thread
+                    log_debug(f"Queueing usage update for existing model...")
+                    queue_model_usage(save_path)
                 else:
                     log_debug(f"Model not found in database, registering it...")
                     # Register model if it's not in the database
@@ -415,10 +422,19 @@ class EmProps_Asset_Downloader:
             log_debug(f"Downloading {url} to {os.path.join(save_to, filename)}")
             log_debug(f"Request headers: {{k: '****' if 'authorization' in k.lower() else v for k, v in headers.items()}}")
             
-            response = requests.get(url, headers=headers, stream=True)
+            # Updated: 2026-10-16 - Pooled keep-alive session shared with the other nodes
+            response = get_http_session().get(url, headers=headers, stream=True, timeout=60)
             response.raise_for_status()
 
             total_size = int(response.headers.get('content-length', 0))
+            # Added: 2026-10-16 - Only the headers of this response are needed for a ranged download
+            use_ranges = (
+                total_size > _RANGED_DOWNLOAD_THRESHOLD
+                and response.headers.get('accept-ranges', '').lower() == 'bytes'
+                and 'content-encoding' not in response.headers
+            )
+            if use_ranges:
+                response.close()
             
             # Ensure parent directory exists
             parent_dir = os.path.dirname(temp_path)
@@ -428,26 +444,39 @@ class EmProps_Asset_Downloader:
 
             downloaded = 0
             last_progress_update = 0
+            # Added: 2026-10-16 - Ranged parts report progress from worker threads
+            progress_lock = threading.Lock()
             
             try:
-                with open(temp_path, 'wb') as file:
-                    with tqdm(total=total_size, unit='iB', unit_scale=True, desc=filename) as pbar:
-                        for data in response.iter_content(chunk_size=4*1024*1024):
-                            size = file.write(data)
+                with tqdm(total=total_size, unit='iB', unit_scale=True, desc=filename) as pbar:
+                    # Updated: 2026-10-16 - Shared by the ranged and single-stream paths
+                    def report_progress(size):
+                        nonlocal downloaded, last_progress_update
+                        with progress_lock:
                             downloaded += size
                             pbar.update(size)
 
                             if total_size > 0:
                                 progress = (downloaded / total_size) * 100.0
-                                if (progress - last_progress_update) > 0.2:
+                                if (progress - last_progress_update) > 0.2 or downloaded >= total_size:
                                     log_debug(f"Downloading {filename}... {progress:.1f}%")
                                     last_progress_update = progress
-                                if progress is not None and hasattr(self, 'node_id'):
-                                    PromptServer.instance.send_sync("progress", {
-                                        "node": self.node_id,
-                                        "value": progress,
-                                        "max": 100
-                                    })
+                                    # Updated: 2026-10-16 - Throttled with the log line instead of once per chunk
+                                    if hasattr(self, 'node_id'):
+                                        PromptServer.instance.send_sync("progress", {
+                                            "node": self.node_id,
+                                            "value": progress,
+                                            "max": 100
+                                        })
+
+                    if use_ranges:
+                        log_debug(f"Server accepts ranges; downloading {filename} in {_RANGED_DOWNLOAD_PARTS} parts")
+                        download_ranged(get_http_session(), url, headers, temp_path, total_size, report_progress,
+                                        parts=_RANGED_DOWNLOAD_PARTS, chunk_size=_DOWNLOAD_CHUNK_SIZE)
+                    else:
+                        with open(temp_path, 'wb') as file:
+                            for data in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                                report_progress(file.write(data))
                 
                 # Close the file before moving it
             except Exception as e:
@@ -475,13 +504,11 @@ class EmProps_Asset_Downloader:
                 log_debug(f"Error registering model in cache database: {str(e)}")
             
             # Updated: 2025-05-12T14:08:00-04:00 - Refresh model cache
-            log_debug(f"Refreshing model cache for {save_to}")
+            # Updated: 2026-10-16 - Only invalidate this folder; the next lookup rebuilds it lazily
+            # instead of walking the folder here on every download
+            log_debug(f"Invalidating model cache for {save_to}")
             # Clear the filename cache for this folder to force a refresh
-            if save_to in folder_paths.filename_list_cache:
-                del folder_paths.filename_list_cache[save_to]
-            
-            # Force a refresh of the model list
-            folder_paths.get_filename_list(save_to)
+            folder_paths.filename_list_cache.pop(save_to, None)
             
             # Updated: 2025-05-12T15:15:00-04:00 - Return just the filename for compatibility with checkpoint loader
             # Updated: 2025-05-13T16:10:33-04:00 - Return consistent tuple format with both values
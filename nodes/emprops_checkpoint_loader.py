@@ -1,21 +1,27 @@
-import os
-import time
-import traceback
-from server import PromptServer
-import sys
-import folder_paths
+from .helpers.model_path_helper import get_embedding_directories
+from .helpers.log_helper import get_logger, make_log_debug
+from .helpers.loader_base import EmPropsLoaderBase
 import comfy.sd
 
 # Added: 2025-05-13T09:41:00-04:00 - Custom checkpoint loader implementation
-def log_debug(message):
-    """Enhanced logging function with timestamp and stack info"""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    caller = traceback.extract_stack()[-2]
-    file = os.path.basename(caller.filename)
-    line = caller.lineno
-    print(f"[EmProps DEBUG {timestamp}] [{file}:{line}] {message}", flush=True)
+# Updated: 2026-10-16 - Backed by logging: no stack walk, strftime or flush per line, and a
+# single level check when EMPROPS_DEBUG_LOGGING is off
+logger = get_logger("CHECKPOINT_LOADER")
 
-class EmProps_Checkpoint_Loader:
+# Updated: 2026-10-16 - No-op unless EMPROPS_DEBUG_LOGGING is set
+log_debug = make_log_debug(logger)
+
+# Added: 2026-10-16 - Built once at import; INPUT_TYPES is called on every prompt validation
+_INPUT_TYPES = {
+    "required": {
+        "ckpt_name": ("STRING", {"multiline": False, "default": ""}),
+    },
+    "hidden": {
+        "node_id": "UNIQUE_ID"
+    }
+}
+
+class EmProps_Checkpoint_Loader(EmPropsLoaderBase):
     """
     A custom checkpoint loader that explicitly loads files by name,
     bypassing ComfyUI's selection mechanism. This ensures it can load
@@ -27,97 +33,36 @@ class EmProps_Checkpoint_Loader:
     FUNCTION = "load_checkpoint"
     CATEGORY = "EmProps"
     
+    # Added: 2026-10-16 - EmPropsLoaderBase settings
+    FOLDER_KEY = "checkpoints"
+    LABEL = "Checkpoint"
+    CACHE_KIND = "checkpoint"
+    log = staticmethod(log_debug)
+    
+    # Updated: 2026-10-16 - Schema is static; return the module-level dict instead of rebuilding it
+    # on every validation pass
     @classmethod
     def INPUT_TYPES(cls):
-        log_debug("EmProps_Checkpoint_Loader.INPUT_TYPES called")
-        return {
-            "required": {
-                "ckpt_name": ("STRING", {"multiline": False, "default": ""}),
-            },
-            "hidden": {
-                "node_id": "UNIQUE_ID"
-            }
-        }
+        return _INPUT_TYPES
 
     def load_checkpoint(self, ckpt_name, node_id=None):
-        log_debug(f"EmProps_Checkpoint_Loader.load_checkpoint called with ckpt_name={ckpt_name}, node_id={node_id}")
+        log_debug("EmProps_Checkpoint_Loader.load_checkpoint called with ckpt_name=%s, node_id=%s", ckpt_name, node_id)
         
         if not ckpt_name:
             log_debug("EmProps_Checkpoint_Loader: No checkpoint name provided")
             raise ValueError("No checkpoint name provided")
         
-        # Force refresh the cache to ensure we see the latest files
-        log_debug("EmProps_Checkpoint_Loader: Refreshing checkpoint cache")
-        if "checkpoints" in folder_paths.filename_list_cache:
-            del folder_paths.filename_list_cache["checkpoints"]
-        
-        # Get the updated file list
-        checkpoint_files = folder_paths.get_filename_list("checkpoints")
-        log_debug(f"EmProps_Checkpoint_Loader: Available checkpoints: {checkpoint_files}")
-        
-        # Check if the file exists
-        max_attempts = 5
-        attempt = 0
-        ckpt_path = None
-        
-        while attempt < max_attempts:
-            try:
-                log_debug(f"EmProps_Checkpoint_Loader: Attempt {attempt+1} to get path for {ckpt_name}")
-                ckpt_path = folder_paths.get_full_path("checkpoints", ckpt_name)
-                if ckpt_path:
-                    log_debug(f"EmProps_Checkpoint_Loader: Found checkpoint at {ckpt_path}")
-                    break
-            except Exception as e:
-                log_debug(f"EmProps_Checkpoint_Loader: Error getting path: {str(e)}")
-                
-            # If not found, wait a bit and try again (in case it's still being written)
-            log_debug(f"EmProps_Checkpoint_Loader: Checkpoint {ckpt_name} not found, waiting...")
-            time.sleep(1)
-            
-            # Refresh the cache again
-            if "checkpoints" in folder_paths.filename_list_cache:
-                del folder_paths.filename_list_cache["checkpoints"]
-            folder_paths.get_filename_list("checkpoints")
-            
-            attempt += 1
-        
-        if not ckpt_path:
-            log_debug(f"EmProps_Checkpoint_Loader: Checkpoint {ckpt_name} not found after {max_attempts} attempts")
-            raise ValueError(f"Checkpoint {ckpt_name} not found after {max_attempts} attempts")
-        
-        # Load the checkpoint
-        log_debug(f"EmProps_Checkpoint_Loader: Loading checkpoint from {ckpt_path}")
-        try:
-            # Send a progress update
-            if node_id:
-                PromptServer.instance.send_sync("progress", {
-                    "node": node_id,
-                    "value": 0,
-                    "max": 100
-                })
-            
-            # Load the checkpoint
-            out = comfy.sd.load_checkpoint_guess_config(
-                ckpt_path, 
-                output_vae=True, 
-                output_clip=True, 
-                embedding_directory=folder_paths.get_folder_paths("embeddings")
-            )
-            
-            # Send completion progress
-            if node_id:
-                PromptServer.instance.send_sync("progress", {
-                    "node": node_id,
-                    "value": 100,
-                    "max": 100
-                })
-            
-            log_debug(f"EmProps_Checkpoint_Loader: Successfully loaded checkpoint {ckpt_name}")
-            return out[:3]
-            
-        except Exception as e:
-            log_debug(f"EmProps_Checkpoint_Loader: Error loading checkpoint: {str(e)}")
-            raise e
+        # Updated: 2026-10-16 - Path resolution, progress and caching live in EmPropsLoaderBase
+        return self._resolve_and_load([ckpt_name], node_id=node_id)
+
+    def _call_loader(self, paths):
+        out = comfy.sd.load_checkpoint_guess_config(
+            paths[0], 
+            output_vae=True, 
+            output_clip=True, 
+            embedding_directory=get_embedding_directories()
+        )
+        return out[:3]
 
 # Node class mappings for ComfyUI
 NODE_CLASS_MAPPINGS = {
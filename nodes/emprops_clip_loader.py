@@ -1,20 +1,13 @@
-import os
-import time
-import traceback
 from server import PromptServer
-import sys
-import folder_paths
+from .helpers.log_helper import get_logger, make_log_debug
+from .helpers.model_path_helper import get_embedding_directories, resolve_model_path
 import comfy.sd
 import torch
 
 # [2025-05-30T10:38:56-04:00] Custom CLIP loader implementation (CLIPLoader)
-def log_debug(message):
-    """Enhanced logging function with timestamp and stack info"""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    caller = traceback.extract_stack()[-2]
-    file = os.path.basename(caller.filename)
-    line = caller.lineno
-    print(f"[EmProps DEBUG {timestamp}] [{file}:{line}] {message}", flush=True)
+# Updated: 2026-10-16 - Shared EmProps logger; no-op unless EMPROPS_DEBUG_LOGGING is set
+logger = get_logger("CLIP_LOADER")
+log_debug = make_log_debug(logger)
 
 class EmProps_CLIP_Loader:
     """
@@ -71,7 +64,7 @@ hidream: llama-3.1 (Recommend) or t5"""
         }
 
     def load_clip(self, clip_name, type="stable_diffusion", device="default", node_id=None):
-        log_debug(f"EmProps_CLIP_Loader.load_clip called with clip_name={clip_name}, type={type}, device={device}, node_id={node_id}")
+        log_debug("EmProps_CLIP_Loader.load_clip called with clip_name=%s, type=%s, device=%s, node_id=%s", clip_name, type, device, node_id)
         
         if not clip_name:
             log_debug("EmProps_CLIP_Loader: No CLIP name provided")
@@ -85,47 +78,17 @@ hidream: llama-3.1 (Recommend) or t5"""
         if device == "cpu":
             model_options["load_device"] = model_options["offload_device"] = torch.device("cpu")
         
-        # Force refresh the cache to ensure we see the latest files
-        log_debug("EmProps_CLIP_Loader: Refreshing text_encoders cache")
-        if "text_encoders" in folder_paths.filename_list_cache:
-            del folder_paths.filename_list_cache["text_encoders"]
-        
-        # Get the updated file list
-        clip_files = folder_paths.get_filename_list("text_encoders")
-        log_debug(f"EmProps_CLIP_Loader: Available CLIP models: {clip_files}")
-        
-        # Check if the file exists
+        # Updated: 2026-10-16 - Resolve directly instead of relisting the folder first; the folder
+        # is only rescanned if the file is missing
         max_attempts = 5
-        attempt = 0
-        clip_path = None
-        
-        while attempt < max_attempts:
-            try:
-                log_debug(f"EmProps_CLIP_Loader: Attempt {attempt+1} to get path for {clip_name}")
-                clip_path = folder_paths.get_full_path("text_encoders", clip_name)
-                if clip_path:
-                    log_debug(f"EmProps_CLIP_Loader: Found CLIP at {clip_path}")
-                    break
-            except Exception as e:
-                log_debug(f"EmProps_CLIP_Loader: Error getting path: {str(e)}")
-                
-            # If not found, wait a bit and try again (in case it's still being written)
-            log_debug(f"EmProps_CLIP_Loader: CLIP {clip_name} not found, waiting...")
-            time.sleep(1)
-            
-            # Refresh the cache again
-            if "text_encoders" in folder_paths.filename_list_cache:
-                del folder_paths.filename_list_cache["text_encoders"]
-            folder_paths.get_filename_list("text_encoders")
-            
-            attempt += 1
+        clip_path = resolve_model_path("text_encoders", clip_name, max_attempts=max_attempts, log=log_debug)
         
         if not clip_path:
-            log_debug(f"EmProps_CLIP_Loader: CLIP {clip_name} not found after {max_attempts} attempts")
+            log_debug("EmProps_CLIP_Loader: CLIP %s not found after %s attempts", clip_name, max_attempts)
             raise ValueError(f"CLIP {clip_name} not found after {max_attempts} attempts")
         
         # Load the model
-        log_debug(f"EmProps_CLIP_Loader: Loading CLIP from {clip_path} with type {clip_type} and options {model_options}")
+        log_debug("EmProps_CLIP_Loader: Loading CLIP from %s with type %s and options %s", clip_path, clip_type, model_options)
         try:
             # Send a progress update
             if node_id:
@@ -138,7 +101,7 @@ hidream: llama-3.1 (Recommend) or t5"""
             # Load the CLIP model using the same function as CLIPLoader
             clip = comfy.sd.load_clip(
                 ckpt_paths=[clip_path], 
-                embedding_directory=folder_paths.get_folder_paths("embeddings"), 
+                embedding_directory=get_embedding_directories(), 
                 clip_type=clip_type, 
                 model_options=model_options
             )
@@ -151,11 +114,11 @@ hidream: llama-3.1 (Recommend) or t5"""
                     "max": 100
                 })
             
-            log_debug(f"EmProps_CLIP_Loader: Successfully loaded CLIP {clip_name}")
+            log_debug("EmProps_CLIP_Loader: Successfully loaded CLIP %s", clip_name)
             return (clip,)
             
         except Exception as e:
-            log_debug(f"EmProps_CLIP_Loader: Error loading CLIP: {str(e)}")
+            log_debug("EmProps_CLIP_Loader: Error loading CLIP: %s", e)
             raise e
 
 # Node class mappings for ComfyUI
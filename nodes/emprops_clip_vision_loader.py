@@ -1,11 +1,12 @@
-import os
-import torch
 import folder_paths
 import comfy.clip_vision
-from .. import log_debug  # Updated: 2025-06-02T11:10:11-04:00 - Import from main package
-from comfy.cli_args import args
+from .helpers.log_helper import get_logger, make_log_debug
 from server import PromptServer
 
+# Updated: 2026-10-16 - Shared EmProps logger; no-op unless EMPROPS_DEBUG_LOGGING is set
+logger = get_logger("CLIP_VISION_LOADER")
+log_debug = make_log_debug(logger)
+
 class EmProps_CLIP_Vision_Loader:
     """
     A custom CLIP Vision loader that explicitly loads files by name,
@@ -31,7 +32,7 @@ class EmProps_CLIP_Vision_Loader:
         }
 
     def load_clip_vision(self, clip_vision_name, node_id=None):
-        log_debug(f"EmProps_CLIP_Vision_Loader.load_clip_vision called with clip_vision_name={clip_vision_name}")
+        log_debug("EmProps_CLIP_Vision_Loader.load_clip_vision called with clip_vision_name=%s", clip_vision_name)
         
         if not clip_vision_name:
             raise ValueError("CLIP vision model name cannot be empty")
@@ -70,11 +71,11 @@ class EmProps_CLIP_Vision_Loader:
                     "max": 100
                 })
             
-            log_debug(f"EmProps_CLIP_Vision_Loader: Successfully loaded CLIP vision model {clip_vision_name}")
+            log_debug("EmProps_CLIP_Vision_Loader: Successfully loaded CLIP vision model %s", clip_vision_name)
             return (clip_vision,)
             
         except Exception as e:
-            log_debug(f"EmProps_CLIP_Vision_Loader: Error loading CLIP vision model: {str(e)}")
+            log_debug("EmProps_CLIP_Vision_Loader: Error loading CLIP vision model: %s", e)
             raise e
 
 # For backwards compatibility with some workflows
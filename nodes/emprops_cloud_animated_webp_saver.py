@@ -1,18 +1,25 @@
 import os
 import sys
-import boto3  # type: ignore # Will be fixed with types-boto3
 import folder_paths  # type: ignore # Custom module without stubs
 import traceback
 import time
-import json
-import numpy as np
+import threading
+import requests  # type: ignore # Will be fixed with types-requests
 from PIL import Image
 from PIL.PngImagePlugin import PngInfo
 from dotenv import load_dotenv
 from typing import Optional, Tuple, List, Dict, Any
 from io import BytesIO
-from ..utils import unescape_env_value, S3Handler, GCSHandler, AzureHandler, GCS_AVAILABLE, AZURE_AVAILABLE
-from .helpers.image_save_helper import ImageSaveHelper
+from concurrent.futures import ThreadPoolExecutor
+from ..utils import unescape_env_value, get_http_session, CDN_PROBE_TIMEOUT, get_s3_client, get_gcs_handler, get_azure_handler, GCSHandler, AzureHandler, GCS_AVAILABLE, AZURE_AVAILABLE
+from .helpers.image_save_helper import ImageSaveHelper, json_dumps, write_file_bytes
+
+# Updated: 2026-10-16 - Import once at load time instead of on every Azure upload
+if AZURE_AVAILABLE:
+    from azure.storage.blob import ContentSettings
+
+# Added: 2026-10-16 - Frame count from which PIL conversion is spread over a thread pool
+PARALLEL_FRAME_THRESHOLD = 8
 
 # Added: 2025-09-30 - Enhanced logging for debugging
 def log_debug(message):
@@ -220,12 +227,20 @@ class EmpropsCloudAnimatedWebpSaver:
         # Get WebP compression method
         webp_method = self.methods.get(method, 4)
 
+        # Added: 2026-10-16 - Per-call constants shared by the local and cloud saves
+        duration_ms = max(1, int(1000.0 / fps))
+        if not prefix.endswith('/'):
+            prefix += '/'
+
         log_debug(f"save_animated_webp_to_cloud called with provider: {provider}, bucket: {bucket}, prefix: {prefix}, filename: {filename}")
         log_debug(f"WebP settings - fps: {fps}, lossless: {lossless}, quality: {quality}, method: {method} ({webp_method})")
         log_debug(f"Images type: {type(images)}, shape: {images.shape if hasattr(images, 'shape') else 'unknown'}")
         log_debug(f"Prompt: {'Present' if prompt else 'None'}, extra_pnginfo: {'Present' if extra_pnginfo else 'None'}")
 
         # First save locally for preview (based on SaveAnimatedWEBP logic)
+        # Fixed: 2026-10-16 - Both stay None unless the encode succeeds, so a failed encode is never uploaded
+        webp_bytes = None
+        webp_size = None
         try:
             # Use the filename directly without any prefix appending
             full_output_folder, local_filename, counter, subfolder, _ = folder_paths.get_save_image_path(
@@ -235,41 +250,61 @@ class EmpropsCloudAnimatedWebpSaver:
                 images[0].shape[0]
             )
             log_debug(f"Local save path info - folder: {full_output_folder}, local_filename: {local_filename}, counter: {counter}, subfolder: {subfolder}")
+            webp_filename = f"{filename}_{counter:05}_.webp"
 
             # Convert images to PIL format
-            pil_images = []
-            for image in images:
-                i = 255. * image.cpu().numpy()
-                img = Image.fromarray(np.clip(i, 0, 255).astype(np.uint8))
-                pil_images.append(img)
+            # Updated: 2026-10-16 - Convert frame by frame in torch (same helper as the image saver)
+            # Fixed: 2026-10-16 - No float32 copy of the whole clip; peak extra memory is about one frame
+            def to_pil(frame):
+                return Image.fromarray(self.image_helper._to_uint8_array(frame))
+
+            frame_count = images.shape[0]
+            if frame_count >= PARALLEL_FRAME_THRESHOLD:
+                # torch and Pillow release the GIL while copying pixel data, so long clips convert in parallel
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+                    pil_images = list(executor.map(to_pil, (images[k] for k in range(frame_count))))
+            else:
+                pil_images = [to_pil(images[k]) for k in range(frame_count)]
             log_debug(f"Converted {len(pil_images)} images to PIL format")
 
             # Prepare metadata for WebP (using EXIF like SaveAnimatedWEBP)
             metadata = pil_images[0].getexif()
             if prompt is not None:
-                metadata[0x0110] = "prompt:{}".format(json.dumps(prompt))
+                metadata[0x0110] = "prompt:{}".format(json_dumps(prompt))
             if extra_pnginfo is not None:
                 initial_exif = 0x010f
                 for x in extra_pnginfo:
-                    metadata[initial_exif] = "{}:{}".format(x, json.dumps(extra_pnginfo[x]))
+                    metadata[initial_exif] = "{}:{}".format(x, json_dumps(extra_pnginfo[x]))
                     initial_exif -= 1
             log_debug(f"Prepared metadata with {len(metadata)} entries")
 
-            # Save locally for UI preview (use user-specified filename)
-            local_file = f"{filename}_{counter:05}_.webp"
-            local_full_path = os.path.join(full_output_folder, local_file)
-
-            log_debug(f"Saving local animated WebP: {local_full_path}")
+            # Updated: 2026-10-16 - Encode once in memory; the same buffer is written
+            # to disk for the UI preview and uploaded to cloud storage below.
+            # No need to presize the buffer: Pillow assembles the whole animation
+            # in libwebp and hands it to the stream in a single write().
+            encoded = BytesIO()
             pil_images[0].save(
-                local_full_path,
+                encoded,
+                format='WEBP',
                 save_all=True,
-                duration=int(1000.0/fps),
+                duration=duration_ms,
                 append_images=pil_images[1:],
                 exif=metadata,
                 lossless=lossless,
                 quality=quality,
                 method=webp_method
             )
+            # Updated: 2026-10-16 - Read the size from the stream position instead of copying the buffer
+            webp_size = encoded.tell()
+            webp_bytes = encoded
+            log_debug(f"Created animated WebP in memory, size: {webp_size} bytes")
+
+            # Save locally for UI preview (use user-specified filename)
+            local_file = webp_filename
+            local_full_path = os.path.join(full_output_folder, local_file)
+
+            log_debug(f"Saving local animated WebP: {local_full_path}")
+            write_file_bytes(local_full_path, webp_bytes.getbuffer())
             log_debug(f"Successfully saved local file: {local_file}")
 
             local_results = [{
@@ -289,12 +324,8 @@ class EmpropsCloudAnimatedWebpSaver:
             # Initialize the appropriate cloud storage client based on provider
             if provider == "aws":
                 # Initialize S3 client with explicit credentials
-                s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=self.aws_access_key,
-                    aws_secret_access_key=self.aws_secret_key,
-                    region_name=self.aws_region
-                )
+                # Updated: 2026-10-16 - Shared, pooled client reused across node runs
+                s3_client = get_s3_client(self.aws_access_key, self.aws_region)
                 log_debug(f"Initialized AWS S3 client for region: {self.aws_region}")
 
             elif provider == "google":
@@ -302,7 +333,7 @@ class EmpropsCloudAnimatedWebpSaver:
                     raise ValueError("Google Cloud Storage is not available. Install with 'pip install google-cloud-storage'")
 
                 # Initialize GCS handler
-                gcs_handler = GCSHandler(bucket)
+                gcs_handler = get_gcs_handler(bucket)
                 log_debug("Initialized Google Cloud Storage handler")
 
                 # Check if GCS client is initialized
@@ -315,7 +346,7 @@ class EmpropsCloudAnimatedWebpSaver:
 
                 # Initialize Azure handler
                 log_debug(f"Initializing Azure handler with container: {bucket}")
-                azure_handler = AzureHandler(bucket)
+                azure_handler = get_azure_handler(bucket)
 
                 # Check if Azure client is initialized
                 if not azure_handler.blob_service_client or not azure_handler.container_client:
@@ -323,29 +354,12 @@ class EmpropsCloudAnimatedWebpSaver:
             else:
                 raise ValueError(f"Unsupported provider: {provider}")
 
-            # Ensure prefix ends with '/'
-            if not prefix.endswith('/'):
-                prefix += '/'
-
-            # Create animated WebP in memory for cloud upload
-            webp_bytes = BytesIO()
-            pil_images[0].save(
-                webp_bytes,
-                format='WEBP',
-                save_all=True,
-                duration=int(1000.0/fps),
-                append_images=pil_images[1:],
-                exif=metadata,
-                lossless=lossless,
-                quality=quality,
-                method=webp_method
-            )
+            if webp_bytes is None:
+                raise ValueError("Animated WebP could not be encoded, nothing to upload")
             webp_bytes.seek(0)
-            log_debug(f"Created animated WebP in memory, size: {len(webp_bytes.getvalue())} bytes")
 
-            # Generate cloud filename
-            cloud_filename = f"{filename}_{counter:05}_.webp"
-            storage_key = prefix + cloud_filename
+            # Generate cloud storage key
+            storage_key = prefix + webp_filename
 
             # Upload based on provider
             if provider == "aws":
@@ -393,12 +407,15 @@ class EmpropsCloudAnimatedWebpSaver:
                     webp_bytes.seek(0)
 
                     # Upload the blob with content settings
-                    from azure.storage.blob import ContentSettings
                     content_settings = ContentSettings(content_type='image/webp')
+                    # Updated: 2026-10-16 - Parallel block uploads; a known length lets the SDK
+                    # choose block sizes without probing the stream
                     blob_client.upload_blob(
                         webp_bytes,
+                        length=webp_size,
                         overwrite=True,
-                        content_settings=content_settings
+                        content_settings=content_settings,
+                        max_concurrency=int(os.getenv('EMPROPS_AZURE_CONCURRENCY', '8'))
                     )
 
                     # Verify upload
@@ -418,75 +435,38 @@ class EmpropsCloudAnimatedWebpSaver:
             print(f"[EmProps] Error saving animated WebP to cloud storage: {str(e)}", flush=True)
             raise e
 
-    def verify_s3_upload(self, s3_client, bucket: str, key: str, max_attempts: int = 5, delay: int = 1) -> bool:
-        """Verify that a file exists in S3 by checking with head_object"""
-        import time
+    # Updated: 2026-10-16 - Single check: S3 is strongly consistent for read-after-write, polling only added sleeps
+    def verify_s3_upload(self, s3_client, bucket: str, key: str) -> bool:
+        """Verify that a file exists in S3 with a single head_object call"""
+        try:
+            s3_client.head_object(Bucket=bucket, Key=key)
+            return True
+        except Exception as e:
+            print(f"[EmProps] Warning: Could not verify S3 upload: {str(e)}")
+            return False
 
-        for attempt in range(max_attempts):
-            try:
-                s3_client.head_object(Bucket=bucket, Key=key)
+    # Updated: 2026-10-16 - Single check: GCS uploads are strongly consistent
+    def verify_gcs_upload(self, gcs_handler: GCSHandler, key: str) -> bool:
+        """Verify that a file exists in GCS with a single exists check"""
+        try:
+            if gcs_handler.object_exists(key):
                 return True
-            except Exception as e:
-                if attempt < max_attempts - 1:
-                    print(f"[EmProps] Waiting for S3 file to be available... attempt {attempt + 1}/{max_attempts}")
-                    time.sleep(delay)
-                else:
-                    print(f"[EmProps] Warning: Could not verify S3 upload: {str(e)}")
-                    return False
-        return False
-
-    def verify_gcs_upload(self, gcs_handler: GCSHandler, key: str, max_attempts: int = 5, delay: int = 1) -> bool:
-        """Verify that a file exists in GCS by checking with exists method"""
-        import time
-
-        for attempt in range(max_attempts):
-            try:
-                if gcs_handler.object_exists(key):
-                    return True
-                if attempt < max_attempts - 1:
-                    print(f"[EmProps] Waiting for GCS file to be available... attempt {attempt + 1}/{max_attempts}")
-                    time.sleep(delay)
-                else:
-                    print(f"[EmProps] Warning: Could not verify GCS upload")
-                    return False
-            except Exception as e:
-                if attempt < max_attempts - 1:
-                    print(f"[EmProps] Error checking GCS file, retrying... attempt {attempt + 1}/{max_attempts}")
-                    time.sleep(delay)
-                else:
-                    print(f"[EmProps] Warning: Could not verify GCS upload: {str(e)}")
-                    return False
+            print(f"[EmProps] Warning: Could not verify GCS upload")
+        except Exception as e:
+            print(f"[EmProps] Warning: Could not verify GCS upload: {str(e)}")
         return False
 
-    def verify_azure_upload(self, azure_handler: AzureHandler, key: str, bucket: str, max_attempts: int = 5, delay: int = 1) -> bool:
+    def verify_azure_upload(self, azure_handler: AzureHandler, key: str, bucket: str) -> bool:
         """Verify that a file exists in Azure Blob Storage and optionally check CDN availability for production bucket"""
-        import time
-        import requests
-
-        # First verify blob storage
-        blob_verified = False
-        for attempt in range(max_attempts):
-            try:
-                if azure_handler.object_exists(key):
-                    blob_verified = True
-                    print(f"[EmProps] Azure blob verified: {key}")
-                    break
-                if attempt < max_attempts - 1:
-                    print(f"[EmProps] Waiting for Azure blob to be available... attempt {attempt + 1}/{max_attempts}")
-                    time.sleep(delay)
-                else:
-                    print(f"[EmProps] Warning: Could not verify Azure upload")
-                    return False
-            except Exception as e:
-                if attempt < max_attempts - 1:
-                    print(f"[EmProps] Error checking Azure blob, retrying... attempt {attempt + 1}/{max_attempts}")
-                    time.sleep(delay)
-                else:
-                    print(f"[EmProps] Warning: Could not verify Azure upload: {str(e)}")
-                    return False
-
-        if not blob_verified:
+        # Updated: 2026-10-16 - Single check: Azure blob uploads are strongly consistent
+        try:
+            if not azure_handler.object_exists(key):
+                print(f"[EmProps] Warning: Could not verify Azure upload")
+                return False
+        except Exception as e:
+            print(f"[EmProps] Warning: Could not verify Azure upload: {str(e)}")
             return False
+        print(f"[EmProps] Azure blob verified: {key}")
 
         # Only check CDN for production container
         if bucket != self.production_cdn_container:
@@ -499,35 +479,20 @@ class EmpropsCloudAnimatedWebpSaver:
         if not cdn_base.startswith(('http://', 'https://')):
             cdn_base = f"https://{cdn_base}"
         cdn_url = f"{cdn_base}/{key}"
-        print(f"[EmProps] Verifying CDN availability at: {cdn_url}")
-
-        # Increase max attempts for CDN propagation
-        cdn_max_attempts = 6
-        cdn_delay = 5
-
-        for attempt in range(cdn_max_attempts):
-            try:
-                response = requests.head(cdn_url, timeout=10)
-                if response.status_code == 200:
-                    print(f"[EmProps] CDN verified: {cdn_url}")
-                    return True
-                elif response.status_code == 404:
-                    if attempt < cdn_max_attempts - 1:
-                        print(f"[EmProps] Waiting for CDN propagation... attempt {attempt + 1}/{cdn_max_attempts} (status: {response.status_code})")
-                        time.sleep(cdn_delay)
-                    else:
-                        print(f"[EmProps] Warning: CDN not available after {cdn_max_attempts * cdn_delay} seconds")
-                        return False
-                else:
-                    print(f"[EmProps] Unexpected CDN response status: {response.status_code}")
-                    if attempt < cdn_max_attempts - 1:
-                        time.sleep(cdn_delay)
-            except requests.exceptions.RequestException as e:
-                if attempt < cdn_max_attempts - 1:
-                    print(f"[EmProps] Error checking CDN, retrying... attempt {attempt + 1}/{cdn_max_attempts}: {str(e)}")
-                    time.sleep(cdn_delay)
-                else:
-                    print(f"[EmProps] Warning: Could not verify CDN availability: {str(e)}")
-                    return False
+        # Updated: 2026-10-16 - Probe the CDN in the background instead of blocking the node
+        # for up to 30 seconds; the blob itself is already verified at this point
+        print(f"[EmProps] Checking CDN availability in the background: {cdn_url}")
+        threading.Thread(target=self._async_cdn_probe, args=(cdn_url,), daemon=True).start()
+        return True
+
+    def _async_cdn_probe(self, cdn_url: str) -> None:
+        """Issue a single HEAD against the CDN and log the outcome (runs on a daemon thread)"""
 
-        return False
\ No newline at end of file
+        try:
+            response = get_http_session().head(cdn_url, timeout=CDN_PROBE_TIMEOUT)
+            if response.status_code == 200:
+                print(f"[EmProps] CDN verified: {cdn_url}")
+            else:
+                print(f"[EmProps] Warning: CDN returned status {response.status_code} for {cdn_url}")
+        except requests.exceptions.RequestException as e:
+            print(f"[EmProps] Warning: Could not verify CDN availability: {str(e)}")
@@ -1,22 +1,40 @@
-import os
-import time
-import traceback
-from server import PromptServer
-import sys
-import folder_paths
+from .helpers.log_helper import get_logger, make_log_debug
+from .helpers.loader_base import EmPropsLoaderBase
 import comfy.sd
 import torch
 
 # [2025-05-30T10:38:56-04:00] Custom Diffusion Model loader implementation (UNETLoader)
-def log_debug(message):
-    """Enhanced logging function with timestamp and stack info"""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    caller = traceback.extract_stack()[-2]
-    file = os.path.basename(caller.filename)
-    line = caller.lineno
-    print(f"[EmProps DEBUG {timestamp}] [{file}:{line}] {message}", flush=True)
+# Updated: 2026-10-16 - Backed by logging: no stack walk, strftime or flush per line, and a
+# single level check when EMPROPS_DEBUG_LOGGING is off
+logger = get_logger("DIFFUSION_MODEL_LOADER")
 
-class EmProps_Diffusion_Model_Loader:
+# Updated: 2026-10-16 - No-op unless EMPROPS_DEBUG_LOGGING is set
+log_debug = make_log_debug(logger)
+
+# Added: 2026-10-16 - model_options for each weight_dtype choice
+_WEIGHT_DTYPE_OPTIONS = {
+    "default": {},
+    "fp8_e4m3fn": {"dtype": torch.float8_e4m3fn},
+    "fp8_e4m3fn_fast": {"dtype": torch.float8_e4m3fn, "fp8_optimizations": True},
+    "fp8_e5m2": {"dtype": torch.float8_e5m2},
+}
+
+# Added: 2026-10-16 - Built once at import; INPUT_TYPES is called on every prompt validation
+_INPUT_TYPES = {
+    "required": {
+        "unet_name": ("STRING", {"multiline": False, "default": ""}),
+        "weight_dtype": (list(_WEIGHT_DTYPE_OPTIONS), {"default": "default"}),
+    },
+    # Added: 2026-10-16 - Memory-map pickled checkpoints instead of reading them into RAM
+    "optional": {
+        "use_mmap": ("BOOLEAN", {"default": True, "advanced": True}),
+    },
+    "hidden": {
+        "node_id": "UNIQUE_ID"
+    }
+}
+
+class EmProps_Diffusion_Model_Loader(EmPropsLoaderBase):
     """
     A custom diffusion model loader that matches the ComfyUI UNETLoader structure
     but with EmProps' custom downloading and offloading capabilities.
@@ -27,110 +45,75 @@ class EmProps_Diffusion_Model_Loader:
     FUNCTION = "load_unet"
     CATEGORY = "EmProps"
     
+    # Added: 2026-10-16 - EmPropsLoaderBase settings
+    FOLDER_KEY = "diffusion_models"
+    LABEL = "Model"
+    CACHE_KIND = "diffusion_model"
+    log = staticmethod(log_debug)
+    
     DESCRIPTION = "Loads a diffusion model with EmProps' custom downloading and offloading capabilities."
     
+    # Updated: 2026-10-16 - Schema is static; return the module-level dict instead of rebuilding it
+    # on every validation pass
     @classmethod
     def INPUT_TYPES(cls):
-        log_debug("EmProps_Diffusion_Model_Loader.INPUT_TYPES called")
-        return {
-            "required": {
-                "unet_name": ("STRING", {"multiline": False, "default": ""}),
-                "weight_dtype": ([
-                    "default", 
-                    "fp8_e4m3fn", 
-                    "fp8_e4m3fn_fast", 
-                    "fp8_e5m2"
-                ], {"default": "default"}),
-            },
-            "hidden": {
-                "node_id": "UNIQUE_ID"
-            }
-        }
+        return _INPUT_TYPES
 
-    def load_unet(self, unet_name, weight_dtype="default", node_id=None):
-        log_debug(f"EmProps_Diffusion_Model_Loader.load_unet called with unet_name={unet_name}, weight_dtype={weight_dtype}, node_id={node_id}")
+    def load_unet(self, unet_name, weight_dtype="default", use_mmap=True, node_id=None):
+        log_debug("EmProps_Diffusion_Model_Loader.load_unet called with unet_name=%s, weight_dtype=%s, use_mmap=%s, node_id=%s", unet_name, weight_dtype, use_mmap, node_id)
         
         if not unet_name:
             log_debug("EmProps_Diffusion_Model_Loader: No model name provided")
             raise ValueError("No model name provided")
         
         # Set model options based on weight_dtype
-        model_options = {}
-        if weight_dtype == "fp8_e4m3fn":
-            model_options["dtype"] = torch.float8_e4m3fn
-        elif weight_dtype == "fp8_e4m3fn_fast":
-            model_options["dtype"] = torch.float8_e4m3fn
-            model_options["fp8_optimizations"] = True
-        elif weight_dtype == "fp8_e5m2":
-            model_options["dtype"] = torch.float8_e5m2
-        
-        # Force refresh the cache to ensure we see the latest files
-        log_debug("EmProps_Diffusion_Model_Loader: Refreshing diffusion_models cache")
-        if "diffusion_models" in folder_paths.filename_list_cache:
-            del folder_paths.filename_list_cache["diffusion_models"]
+        # Updated: 2026-10-16 - Table lookup; unknown values fail loudly instead of loading at default precision
+        if weight_dtype not in _WEIGHT_DTYPE_OPTIONS:
+            raise ValueError(f"Unsupported weight_dtype: {weight_dtype}")
+        model_options = dict(_WEIGHT_DTYPE_OPTIONS[weight_dtype])
         
-        # Get the updated file list
-        model_files = folder_paths.get_filename_list("diffusion_models")
-        log_debug(f"EmProps_Diffusion_Model_Loader: Available diffusion models: {model_files}")
-        
-        # Check if the file exists
-        max_attempts = 5
-        attempt = 0
-        model_path = None
-        
-        while attempt < max_attempts:
-            try:
-                log_debug(f"EmProps_Diffusion_Model_Loader: Attempt {attempt+1} to get path for {unet_name}")
-                model_path = folder_paths.get_full_path("diffusion_models", unet_name)
-                if model_path:
-                    log_debug(f"EmProps_Diffusion_Model_Loader: Found model at {model_path}")
-                    break
-            except Exception as e:
-                log_debug(f"EmProps_Diffusion_Model_Loader: Error getting path: {str(e)}")
-                
-            # If not found, wait a bit and try again (in case it's still being written)
-            log_debug(f"EmProps_Diffusion_Model_Loader: Model {unet_name} not found, waiting...")
-            time.sleep(1)
-            
-            # Refresh the cache again
-            if "diffusion_models" in folder_paths.filename_list_cache:
-                del folder_paths.filename_list_cache["diffusion_models"]
-            folder_paths.get_filename_list("diffusion_models")
-            
-            attempt += 1
-        
-        if not model_path:
-            log_debug(f"EmProps_Diffusion_Model_Loader: Model {unet_name} not found after {max_attempts} attempts")
-            raise ValueError(f"Model {unet_name} not found after {max_attempts} attempts")
-        
-        # Load the model
-        log_debug(f"EmProps_Diffusion_Model_Loader: Loading model from {model_path} with options {model_options}")
+        # Updated: 2026-10-16 - Path resolution, progress and caching live in EmPropsLoaderBase
+        model = self._resolve_and_load([unet_name], node_id=node_id, model_options=model_options, use_mmap=use_mmap)
+        return (model,)
+
+    def _call_loader(self, paths, model_options, use_mmap=True):
+        path = paths[0]
+        # Added: 2026-10-16 - .safetensors is already read through a mapping by comfy; pickled
+        # .ckpt/.pt/.pth files are read fully into memory unless torch maps them
+        if use_mmap and not path.lower().endswith(".safetensors"):
+            sd = self._load_state_dict_mmap(path)
+            if sd is not None:
+                model = comfy.sd.load_diffusion_model_state_dict(sd, model_options=model_options)
+                # Fixed: 2026-10-16 - Same check comfy.sd.load_diffusion_model makes
+                if model is None:
+                    raise RuntimeError(f"Could not detect model type of: {path}")
+                return model
+        # Load the model using the same function as UNETLoader
+        return comfy.sd.load_diffusion_model(path, model_options=model_options)
+
+    # Added: 2026-10-16 - Zero-copy state dict for zip-format torch checkpoints
+    def _load_state_dict_mmap(self, path):
+        """Return a memory-mapped state dict, or None when the file cannot be mapped"""
         try:
-            # Send a progress update
-            if node_id:
-                PromptServer.instance.send_sync("progress", {
-                    "node": node_id,
-                    "value": 0,
-                    "max": 100
-                })
-            
-            # Load the model using the same function as UNETLoader
-            model = comfy.sd.load_diffusion_model(model_path, model_options=model_options)
-            
-            # Send completion progress
-            if node_id:
-                PromptServer.instance.send_sync("progress", {
-                    "node": node_id,
-                    "value": 100,
-                    "max": 100
-                })
-            
-            log_debug(f"EmProps_Diffusion_Model_Loader: Successfully loaded model {unet_name}")
-            return (model,)
-            
+            pl_sd = torch.load(path, map_location="cpu", weights_only=True, mmap=True)
         except Exception as e:
-            log_debug(f"EmProps_Diffusion_Model_Loader: Error loading model: {str(e)}")
-            raise e
+            # Fixed: 2026-10-16 - Any failure (legacy non-zip pickles, older torch builds, globals the
+            # weights_only unpickler rejects) falls back to comfy's regular loader
+            log_debug("EmProps_Diffusion_Model_Loader: mmap load unavailable for %s, using the regular loader: %s", path, e)
+            return None
+        # Same unwrapping as comfy.utils.load_torch_file
+        # Fixed: 2026-10-16 - Include the single-key unwrap; anything that is not a dict goes to comfy
+        if not isinstance(pl_sd, dict):
+            return None
+        if "state_dict" in pl_sd:
+            sd = pl_sd["state_dict"]
+        elif len(pl_sd) == 1:
+            sd = next(iter(pl_sd.values()))
+            if not isinstance(sd, dict):
+                sd = pl_sd
+        else:
+            sd = pl_sd
+        return sd
 
 # Node class mappings for ComfyUI
 NODE_CLASS_MAPPINGS = {
@@ -1,11 +1,62 @@
 import os
+import io
 import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import torch
 import numpy as np
 from PIL import Image, ImageOps, ImageSequence
 import folder_paths
 # 2025-04-27 20:59: Updated imports to support multiple cloud providers
-from ..utils import try_download_file, is_url, S3Handler, GCSHandler, AzureHandler, extract_metadata, GCS_AVAILABLE, AZURE_AVAILABLE
+from ..utils import try_download_file, is_url, get_s3_handler, get_gcs_handler, get_azure_handler, extract_metadata, GCS_AVAILABLE, AZURE_AVAILABLE
+from .helpers.log_helper import get_logger, make_log_debug
+
+# Added: 2026-10-16 - Decode details (format, dimensions, per-frame alpha) go to the debug logger;
+# source and error messages stay on stdout. No-op unless EMPROPS_DEBUG_LOGGING is set
+logger = get_logger("IMAGE_LOADER")
+log_debug = make_log_debug(logger)
+
+# Added: 2026-10-16 - OpenCV decodes plain JPEGs straight to a uint8 array (listed in requirements.txt,
+# but optional here)
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+# Added: 2026-10-16 - uint8 -> float32 [0, 1] lookup table; one gather per pixel instead of a
+# float32 cast followed by a divide
+_LUT = np.arange(256, dtype=np.float32) / 255.0
+# Added: 2026-10-16 - Inverted table for the alpha mask (1 - a / 255) so the invert is folded into the lookup
+_INV_LUT = 1.0 - _LUT
+
+# Added: 2026-10-16 - Streamed SHA-256; hashlib.file_digest (3.11+) feeds OpenSSL directly,
+# older interpreters hash in 64 KiB chunks. Neither reads the whole file into memory
+def _sha256_file(path):
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        m = hashlib.sha256()
+        while chunk := f.read(1 << 16):
+            m.update(chunk)
+        return m.hexdigest()
+
+# Added: 2026-10-16 - IS_CHANGED runs on every prompt; (mtime_ns, size) is part of the key, so
+# an unchanged upload costs one stat and an edited one is rehashed
+@functools.lru_cache(maxsize=256)
+def _cached_sha256(path, mtime_ns, size):
+    return _sha256_file(path)
+
+# Added: 2026-10-16 - Per-frame normalization, split out so animated inputs can run it on a pool
+# Updated: 2026-10-16 - Writes the image straight into its slot of the preallocated batch
+def _frame_to_arrays(image, alpha, out):
+    """Fill out (HxWx3 float32) from one decoded frame; return its inverted HxW mask, or None without alpha"""
+    # mode="clip" lets take write into out directly (mode="raise" buffers it); uint8 indices are always in range
+    np.take(_LUT, np.asarray(image), out=out, mode="clip")
+    if alpha is None:
+        return None
+    # The gather returns a fresh, writeable, C-contiguous array, so from_numpy shares its buffer
+    return np.ascontiguousarray(_INV_LUT[np.asarray(alpha)])
 
 class EmpropsImageLoader:
     def __init__(self):
@@ -26,7 +77,9 @@ class EmpropsImageLoader:
     @classmethod
     def INPUT_TYPES(s):
         input_dir = folder_paths.get_input_directory()
-        files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
+        # Updated: 2026-10-16 - scandir carries the entry type, so no stat per file
+        with os.scandir(input_dir) as it:
+            files = sorted(e.name for e in it if e.is_file())
         
         # 2025-04-27 21:00: Determine available providers based on imports
         providers = ["aws"]
@@ -43,7 +96,7 @@ class EmpropsImageLoader:
         return {
             "required": {
                 "source_type": (["upload", "cloud", "public_download"],),
-                "image": (sorted(files),),
+                "image": (files,),
                 "provider": (providers, {"default": default_provider}),
                 "cloud_key": ("STRING", {"default": "", "placeholder": "Path in cloud storage"}),
                 "bucket": ("STRING", {"default": "emprops-share"}),
@@ -59,6 +112,8 @@ class EmpropsImageLoader:
     def load_image(self, **kwargs):
         print(f"[EmProps] Loading image from source type: {kwargs['source_type']}", flush=True)
         
+        # Added: 2026-10-16 - What Image.open reads: image_path, or an in-memory buffer for cloud sources
+        image_source = None
         if kwargs['source_type'] == 'upload':
             image_path = folder_paths.get_annotated_filepath(kwargs['image'])
             print(f"[EmProps] Loading local file: {image_path}", flush=True)
@@ -78,18 +133,14 @@ class EmpropsImageLoader:
                 print(f"[EmProps] Error: No cloud key provided", flush=True)
                 raise Exception("No cloud key provided")
                 
-            temp_dir = folder_paths.get_temp_directory()
-            os.makedirs(temp_dir, exist_ok=True)
-            image_name = os.path.basename(cloud_key)
-            image_path = os.path.join(temp_dir, image_name)
-            
             # Select the appropriate cloud handler based on provider
+            # Updated: 2026-10-16 - Handlers are shared per bucket (utils.get_*_handler)
             if provider == 'aws':
                 print(f"[EmProps] Downloading from AWS S3: {bucket}/{cloud_key}", flush=True)
-                handler = S3Handler(bucket)
+                handler = get_s3_handler(bucket)
             elif provider == 'google':
                 print(f"[EmProps] Downloading from Google Cloud Storage: {bucket}/{cloud_key}", flush=True)
-                handler = GCSHandler(bucket)
+                handler = get_gcs_handler(bucket)
             elif provider == 'azure':
                 # Updated: 2025-05-07T15:40:30-04:00 - Added debug info for Azure credentials
                 print(f"[EmProps] Downloading from Azure Blob Storage: {bucket}/{cloud_key}", flush=True)
@@ -101,84 +152,141 @@ class EmpropsImageLoader:
                 else:
                     print(f"[EmProps] Warning: No Azure Storage Account found in environment variables")
                     
-                handler = AzureHandler(bucket)
+                handler = get_azure_handler(bucket)
             else:
                 print(f"[EmProps] Error: Unsupported cloud provider: {provider}", flush=True)
                 raise Exception(f"Unsupported cloud provider: {provider}")
             
-            # Download the file
-            success, error = handler.download_file(cloud_key, image_path)
-            if not success:
+            # Updated: 2026-10-16 - Download into memory and decode from there instead of writing
+            # the object to the temp directory and reading it back
+            data, error = handler.download_bytes(cloud_key)
+            if data is None:
                 print(f"[EmProps] Error: Failed to download image from {provider}: {error}", flush=True)
                 raise Exception(f"Failed to download image from {provider}: {error}")
+            image_path = cloud_key
+            image_source = io.BytesIO(data)
+
+        if image_source is None:
+            image_source = image_path
+        log_debug("Opening image: %s", image_path)
 
-        print(f"[EmProps] Opening image: {image_path}", flush=True)
 
+        img = Image.open(image_source)
 
-        img = Image.open(image_path)
-        img = ImageOps.exif_transpose(img)
+        # Added: 2026-10-16 - Upright RGB/greyscale JPEGs skip PIL's decode: OpenCV decodes them
+        # into an array that feeds the LUT directly. Rotated, CMYK and MPO files (and everything
+        # that isn't a JPEG) take the PIL path below. Image.open only parsed the header so far
+        if CV2_AVAILABLE and img.format == 'JPEG' and img.mode in ('RGB', 'L') and img.getexif().get(0x0112, 1) == 1:
+            if isinstance(image_source, io.BytesIO):
+                arr = cv2.imdecode(np.frombuffer(image_source.getbuffer(), dtype=np.uint8), cv2.IMREAD_COLOR)
+            else:
+                arr = cv2.imread(image_source, cv2.IMREAD_COLOR)
+            if arr is not None:
+                log_debug("Decoding JPEG with OpenCV")
+                prompt, metadata = extract_metadata(img)
+                h, w = arr.shape[:2]
+                log_debug("Image dimensions: %sx%s", w, h)
+                output_image = torch.empty((1, h, w, 3), dtype=torch.float32)
+                # OpenCV decodes to BGR; gather from the channel-reversed view to get RGB
+                _frame_to_arrays(arr[..., ::-1], None, output_image.numpy()[0])
+                output_mask = torch.zeros((1, 64, 64), dtype=torch.float32, device="cpu")
+                log_debug("Image loading complete")
+                return (output_image, output_mask, prompt, metadata)
+
+        # Fixed: 2026-10-16 - Transpose per frame (as ComfyUI's LoadImage does) instead of replacing
+        # img: exif_transpose returns a single-frame copy, which hid every frame after the first.
+        # Upright files skip it, since it only copies the frame when there is nothing to rotate
+        needs_transpose = img.getexif().get(0x0112, 1) != 1
 
         #metadata start
         prompt, metadata = extract_metadata(img)
         #metadata end
 
-        output_images = []
+        output_image = None
         output_masks = []
         w, h = None, None
 
         excluded_formats = ['MPO']
-        print(f"[EmProps] Processing image format: {img.format}", flush=True)
-
-        for i in ImageSequence.Iterator(img):
-            i = ImageOps.exif_transpose(i)
-
-            if i.mode == 'I':
-                print(f"[EmProps] Converting mode 'I' image", flush=True)
-                i = i.point(lambda i: i * (1 / 255))
-            image = i.convert("RGB")
-
-            if len(output_images) == 0:
-                w = image.size[0]
-                h = image.size[1]
-                print(f"[EmProps] Image dimensions: {w}x{h}", flush=True)
-
-            if image.size[0] != w or image.size[1] != h:
-                print(f"[EmProps] Skipping frame with mismatched dimensions: {image.size[0]}x{image.size[1]}", flush=True)
-                continue
-
-            image = np.array(image).astype(np.float32) / 255.0
-            image = torch.from_numpy(image)[None,]
-            if 'A' in i.getbands():
-                print("[EmProps] Processing alpha channel", flush=True)
-                mask = np.array(i.getchannel('A')).astype(np.float32) / 255.0
-                mask = 1. - torch.from_numpy(mask)
-            else:
-                print("[EmProps] No alpha channel found, creating empty mask", flush=True)
-                mask = torch.zeros((64,64), dtype=torch.float32, device="cpu")
-            output_images.append(image)
-            output_masks.append(mask.unsqueeze(0))
-
-        if len(output_images) > 1 and img.format not in excluded_formats:
-            print(f"[EmProps] Note: Using metadata from first frame for all {len(output_images)} frames", flush=True)
-            print(f"[EmProps] Combining {len(output_images)} frames", flush=True)
-            output_image = torch.cat(output_images, dim=0)
+        log_debug("Processing image format: %s", img.format)
+
+        # Updated: 2026-10-16 - Only the first frame of excluded formats is returned, so size the
+        # batch for one frame there
+        n_frames = getattr(img, 'n_frames', 1)
+        if img.format in excluded_formats:
+            n_frames = 1
+
+        # Updated: 2026-10-16 - Frames are decoded in order (they share one file handle) while
+        # earlier frames are normalized on a thread pool; NumPy releases the GIL for the gather
+        pool = None
+        if n_frames > 1:
+            pool = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, n_frames))
+        pending = []
+        try:
+            for i in ImageSequence.Iterator(img):
+                if needs_transpose or img.format in excluded_formats:
+                    i = ImageOps.exif_transpose(i)
+
+                if i.mode == 'I':
+                    log_debug("Converting mode 'I' image")
+                    i = i.point(lambda i: i * (1 / 255))
+                # Updated: 2026-10-16 - convert() on an RGB frame is a full copy; skip it unless a
+                # pool worker will read the frame after the iterator has moved on
+                image = i if i.mode == 'RGB' and pool is None else i.convert("RGB")
+
+                if output_image is None:
+                    w = image.size[0]
+                    h = image.size[1]
+                    log_debug("Image dimensions: %sx%s", w, h)
+                    # Added: 2026-10-16 - One allocation for the whole batch; frames are written
+                    # into it in place, so there is no torch.cat copy at the end
+                    output_image = torch.empty((n_frames, h, w, 3), dtype=torch.float32)
+                    output_np = output_image.numpy()
+
+                if image.size[0] != w or image.size[1] != h:
+                    log_debug("Skipping frame with mismatched dimensions: %sx%s", image.size[0], image.size[1])
+                    continue
+
+                alpha = i.getchannel('A') if 'A' in i.getbands() else None
+                out = output_np[len(pending)]
+                if pool is not None:
+                    pending.append(pool.submit(_frame_to_arrays, image, alpha, out))
+                else:
+                    pending.append(_frame_to_arrays(image, alpha, out))
+                if len(pending) == n_frames:
+                    break
+
+            for result in pending:
+                mask = result.result() if pool is not None else result
+                if mask is not None:
+                    log_debug("Processing alpha channel")
+                    mask = torch.from_numpy(mask)
+                else:
+                    log_debug("No alpha channel found, creating empty mask")
+                    mask = torch.zeros((64,64), dtype=torch.float32, device="cpu")
+                output_masks.append(mask.unsqueeze_(0))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+
+        if len(output_masks) > 1 and img.format not in excluded_formats:
+            log_debug("Note: Using metadata from first frame for all %s frames", len(output_masks))
+            log_debug("Combining %s frames", len(output_masks))
+            output_image = output_image[:len(output_masks)]
             output_mask = torch.cat(output_masks, dim=0)
         else:
-            print("[EmProps] Using single frame", flush=True)
-            output_image = output_images[0]
+            log_debug("Using single frame")
+            output_image = output_image[:1]
             output_mask = output_masks[0]
 
-        print("[EmProps] Image loading complete", flush=True)
+        log_debug("Image loading complete")
         return (output_image, output_mask, prompt, metadata)
 
     @classmethod
     def IS_CHANGED(s, **kwargs):
         if kwargs.get('source_type') == 'upload':
             image_path = folder_paths.get_annotated_filepath(kwargs['image'])
-            m = hashlib.sha256()
-            with open(image_path, 'rb') as f:
-                m.update(f.read())
-            return m.digest().hex()
+            st = os.stat(image_path)
+            return _cached_sha256(image_path, st.st_mtime_ns, st.st_size)
         elif kwargs.get('source_type') == 'public_download':
             return kwargs.get('url', '')
         # 2025-04-27 21:00: Updated for cloud storage
@@ -1,13 +1,48 @@
 import os
-import requests
-import sys
-import time
-from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
 import folder_paths  # type: ignore # Custom module without stubs
 from nodes import LoraLoader
 from dotenv import load_dotenv
 # 2025-04-27 21:05: Updated imports to support multiple cloud providers
-from ..utils import unescape_env_value, S3Handler, GCSHandler, AzureHandler, GCS_AVAILABLE, AZURE_AVAILABLE
+from ..utils import unescape_env_value, get_s3_handler, get_gcs_handler, get_azure_handler, GCS_AVAILABLE, AZURE_AVAILABLE
+
+# Added: 2026-10-16 - Load .env.local once at import instead of re-parsing it for every node instance
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env.local'))
+
+# Added: 2026-10-16 - Cached handler factory per provider
+# Updated: 2026-10-16 - Probes are read-only; an Azure probe must never create the container
+_HANDLER_FACTORIES = {
+    'aws': get_s3_handler,
+    'google': get_gcs_handler,
+    'azure': lambda container: get_azure_handler(container, create_container=False),
+}
+
+# Added: 2026-10-16 - Explicit fallback locations for LoRAs missing from the selected bucket,
+# e.g. EMPROPS_LORA_FALLBACKS="google:my-gcs-bucket,azure:my-container". Only these exact
+# (provider, bucket) pairs are tried; the node's bucket is never sent to another provider
+def _fallback_sources():
+    """Parse EMPROPS_LORA_FALLBACKS into [(provider, bucket), ...], skipping unusable entries"""
+    available = {'aws': True, 'google': GCS_AVAILABLE, 'azure': AZURE_AVAILABLE}
+    sources = []
+    for entry in os.getenv('EMPROPS_LORA_FALLBACKS', '').split(','):
+        provider, sep, bucket = entry.strip().partition(':')
+        provider, bucket = provider.strip(), bucket.strip()
+        if not sep or not bucket or provider not in _HANDLER_FACTORIES:
+            if entry.strip():
+                print(f"[EmProps] Ignoring invalid EMPROPS_LORA_FALLBACKS entry: {entry.strip()}")
+            continue
+        if available[provider] and (provider, bucket) not in sources:
+            sources.append((provider, bucket))
+    return sources
+
+def _probe(provider, bucket, cloud_path):
+    """Return the handler for provider/bucket if cloud_path exists there, otherwise None"""
+    try:
+        handler = _HANDLER_FACTORIES[provider](bucket)
+        return handler if handler.object_exists(cloud_path) else None
+    except Exception as e:
+        print(f"[EmProps] Could not check {provider} for {bucket}/{cloud_path}: {str(e)}")
+        return None
 
 class EmProps_Lora_Loader:
     """
@@ -17,11 +52,6 @@ class EmProps_Lora_Loader:
         self.lora_loader = None
         self.cloud_prefix = "models/loras/"
 
-        # Load environment variables from .env.local
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        env_path = os.path.join(current_dir, '.env.local')
-        load_dotenv(env_path)
-        
         # 2025-04-27 21:05: Get default cloud provider from environment
         self.default_provider = os.getenv('CLOUD_PROVIDER', 'aws')
         self.default_bucket = "emprops-share"
@@ -124,61 +154,35 @@ class EmProps_Lora_Loader:
         # Construct cloud path
         cloud_path = f"{self.cloud_prefix}{lora_name}"
         
+        if provider not in _HANDLER_FACTORIES:
+            print(f"[EmProps] Error: Unsupported cloud provider: {provider}")
+            return None
+        
         try:
-            # Select the appropriate cloud handler based on provider
-            if provider == 'aws':
-                print(f"[EmProps] Attempting AWS S3 download:")
-                print(f"  FROM: s3://{bucket}/{cloud_path}")
-                print(f"    TO: {local_path}")
-                
-                # Initialize S3 client with unescaped credentials
-                handler = S3Handler(
-                    bucket,
-                    aws_access_key_id=self.aws_access_key,
-                    aws_secret_access_key=self.aws_secret_key,
-                    region_name=self.aws_region
-                )
-                
-                # Check if object exists
-                if not handler.object_exists(cloud_path):
-                    print(f"[EmProps] S3 object not found: s3://{bucket}/{cloud_path}")
-                    return None
-                    
-            elif provider == 'google':
-                print(f"[EmProps] Attempting Google Cloud Storage download:")
-                print(f"  FROM: gs://{bucket}/{cloud_path}")
-                print(f"    TO: {local_path}")
-                
-                # Initialize GCS client
-                handler = GCSHandler(bucket)
-                
-                # Check if object exists
-                if not handler.object_exists(cloud_path):
-                    print(f"[EmProps] GCS object not found: gs://{bucket}/{cloud_path}")
-                    return None
-                    
-            elif provider == 'azure':
-                print(f"[EmProps] Attempting Azure Blob Storage download:")
-                print(f"  FROM: {bucket}/{cloud_path}")
-                print(f"    TO: {local_path}")
-                
-                # Initialize Azure client
-                handler = AzureHandler(bucket)
-                
-                # Check if object exists
-                if not handler.object_exists(cloud_path):
-                    print(f"[EmProps] Azure blob not found: {bucket}/{cloud_path}")
-                    return None
-                    
-            else:
-                print(f"[EmProps] Error: Unsupported cloud provider: {provider}")
+            # Updated: 2026-10-16 - Probe the selected bucket and the configured fallback locations
+            # concurrently; the selected bucket wins whenever it has the file
+            candidates = [(provider, bucket)] + [c for c in _fallback_sources() if c != (provider, bucket)]
+            print(f"[EmProps] Looking for {cloud_path} in: {', '.join(f'{p}:{b}' for p, b in candidates)}")
+            provider, bucket, handler = self._find_in_cloud(candidates, cloud_path)
+            if handler is None:
+                print(f"[EmProps] LoRA not found in cloud storage: {cloud_path}")
                 return None
             
+            print(f"[EmProps] Downloading LoRA from {provider}:")
+            print(f"  FROM: {bucket}/{cloud_path}")
+            print(f"    TO: {local_path}")
+            
             # Download the file
-            success, error = handler.download_file(cloud_path, local_path)
+            # Updated: 2026-10-16 - Download to a .part file and rename it into place, so the
+            # exists check above never sees a partially written LoRA
+            part_path = f"{local_path}.{os.getpid()}.part"
+            success, error = handler.download_file(cloud_path, part_path)
             if not success:
                 print(f"[EmProps] Error downloading LoRA from {provider}: {error}")
+                if os.path.exists(part_path):
+                    os.remove(part_path)
                 return None
+            os.replace(part_path, local_path)
                 
             print(f"[EmProps] Successfully downloaded {lora_name} from {provider}")
             return local_path
@@ -187,6 +191,30 @@ class EmProps_Lora_Loader:
             print(f"[EmProps] Error downloading LoRA from {provider}: {str(e)}")
             return None
 
+    # Added: 2026-10-16 - Concurrent existence checks, resolved in priority order
+    def _find_in_cloud(self, candidates, cloud_path):
+        """
+        Return (provider, bucket, handler) for the first candidate, in list order, that holds
+        cloud_path, or (None, None, None). All candidates are probed at once, so a hit costs the
+        slowest probe ahead of it rather than the sum of them.
+        """
+        if len(candidates) == 1:
+            provider, bucket = candidates[0]
+            handler = _probe(provider, bucket, cloud_path)
+            return (provider, bucket, handler) if handler is not None else (None, None, None)
+        
+        pool = ThreadPoolExecutor(max_workers=len(candidates))
+        try:
+            futures = [pool.submit(_probe, p, b, cloud_path) for p, b in candidates]
+            for (provider, bucket), future in zip(candidates, futures):
+                handler = future.result()
+                if handler is not None:
+                    return provider, bucket, handler
+            return None, None, None
+        finally:
+            # Don't wait for lower-priority probes once there is an answer
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def load_lora(self, model, clip, lora_name, provider, bucket, strength_model, strength_clip):
         """Load LoRA, downloading from cloud storage if necessary"""
         # 2025-04-27 21:05: Updated to support multiple cloud providers
@@ -1,18 +1,12 @@
 import os
-import time
-import traceback
-import folder_paths
 from server import PromptServer
 from nodes import LoraLoader
-import comfy.sd
+from .helpers.log_helper import get_logger, make_log_debug
+from .helpers.model_path_helper import resolve_model_path
 
-def log_debug(message):
-    """Enhanced logging function with timestamp and stack info"""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    caller = traceback.extract_stack()[-2]
-    file = os.path.basename(caller.filename)
-    line = caller.lineno
-    print(f"[EmProps DEBUG {timestamp}] [{file}:{line}] {message}", flush=True)
+# Updated: 2026-10-16 - Shared EmProps logger; no-op unless EMPROPS_DEBUG_LOGGING is set
+logger = get_logger("LORA_LOADER_SIMPLE")
+log_debug = make_log_debug(logger)
 
 class EmProps_Lora_Loader_Simple:
     """
@@ -46,53 +40,26 @@ class EmProps_Lora_Loader_Simple:
         }
 
     def load_lora(self, model, clip, lora_name, strength_model, strength_clip, node_id=None):
-        log_debug(f"EmProps_Lora_Loader_Simple.load_lora called with lora_name={lora_name}, node_id={node_id}")
+        log_debug("EmProps_Lora_Loader_Simple.load_lora called with lora_name=%s, node_id=%s", lora_name, node_id)
         
         if not lora_name:
             log_debug("EmProps_Lora_Loader_Simple: No LoRA name provided")
             return (model, clip)
         
-        # Force refresh the cache to ensure we see the latest files
-        log_debug("EmProps_Lora_Loader_Simple: Refreshing LoRA cache")
-        if "loras" in folder_paths.filename_list_cache:
-            del folder_paths.filename_list_cache["loras"]
-        
-        # Get the updated file list
-        lora_files = folder_paths.get_filename_list("loras")
-        log_debug(f"EmProps_Lora_Loader_Simple: Available LoRAs: {lora_files}")
-        
-        # Check if the file exists
+        # Updated: 2026-10-16 - Resolve directly and wait for the file to be written (inotify/watchdog
+        # when available) instead of sleeping and relisting the folder on every attempt; the loras
+        # listing is no longer dropped and rebuilt up front, only rescanned on a miss
         max_attempts = 5
-        attempt = 0
-        lora_path = None
-        
-        while attempt < max_attempts:
-            try:
-                log_debug(f"EmProps_Lora_Loader_Simple: Attempt {attempt+1} to get path for {lora_name}")
-                lora_path = folder_paths.get_full_path("loras", lora_name)
-                if lora_path:
-                    log_debug(f"EmProps_Lora_Loader_Simple: Found LoRA at {lora_path}")
-                    break
-            except Exception as e:
-                log_debug(f"EmProps_Lora_Loader_Simple: Error getting path: {str(e)}")
-                
-            # If not found, wait a bit and try again (in case it's still being written)
-            log_debug(f"EmProps_Lora_Loader_Simple: LoRA {lora_name} not found, waiting...")
-            time.sleep(1)
-            
-            # Refresh the cache again
-            if "loras" in folder_paths.filename_list_cache:
-                del folder_paths.filename_list_cache["loras"]
-            folder_paths.get_filename_list("loras")
-            
-            attempt += 1
+        lora_path = resolve_model_path("loras", lora_name, max_attempts=max_attempts, log=log_debug)
+        if lora_path:
+            log_debug("EmProps_Lora_Loader_Simple: Found LoRA at %s", lora_path)
         
         if not lora_path:
-            log_debug(f"EmProps_Lora_Loader_Simple: LoRA {lora_name} not found after {max_attempts} attempts")
+            log_debug("EmProps_Lora_Loader_Simple: LoRA %s not found after %s attempts", lora_name, max_attempts)
             return (model, clip)
         
         # Load the LoRA
-        log_debug(f"EmProps_Lora_Loader_Simple: Loading LoRA from {lora_path}")
+        log_debug("EmProps_Lora_Loader_Simple: Loading LoRA from %s", lora_path)
         try:
             # Send a progress update
             if node_id:
@@ -119,11 +86,11 @@ class EmProps_Lora_Loader_Simple:
                     "max": 100
                 })
             
-            log_debug(f"EmProps_Lora_Loader_Simple: Successfully loaded LoRA {lora_name}")
+            log_debug("EmProps_Lora_Loader_Simple: Successfully loaded LoRA %s", lora_name)
             return (model_lora, clip_lora)
             
         except Exception as e:
-            log_debug(f"EmProps_Lora_Loader_Simple: Error loading LoRA: {str(e)}")
+            log_debug("EmProps_Lora_Loader_Simple: Error loading LoRA: %s", e)
             return (model, clip)
 
 # Node class mappings for ComfyUI
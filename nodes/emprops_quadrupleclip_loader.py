@@ -1,20 +1,13 @@
-import os
-import time
-import traceback
 from server import PromptServer
-import sys
-import folder_paths
+from .helpers.log_helper import get_logger, make_log_debug
+from .helpers.model_path_helper import get_embedding_directories, resolve_model_paths
 import comfy.sd
 import torch
 
 # [2025-06-23T14:45:00-08:00] Custom QuadrupleCLIP loader implementation
-def log_debug(message):
-    """Enhanced logging function with timestamp and stack info"""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    caller = traceback.extract_stack()[-2]
-    file = os.path.basename(caller.filename)
-    line = caller.lineno
-    print(f"[EmProps DEBUG {timestamp}] [{file}:{line}] {message}", flush=True)
+# Updated: 2026-10-16 - Shared EmProps logger; no-op unless EMPROPS_DEBUG_LOGGING is set
+logger = get_logger("QUADRUPLECLIP_LOADER")
+log_debug = make_log_debug(logger)
 
 class EmProps_QuadrupleCLIP_Loader:
     """
@@ -49,55 +42,26 @@ class EmProps_QuadrupleCLIP_Loader:
         }
 
     def load_clip(self, clip_name1, clip_name2, clip_name3, clip_name4, device="default", node_id=None):
-        log_debug(f"EmProps_QuadrupleCLIP_Loader.load_clip called with clip_name1={clip_name1}, clip_name2={clip_name2}, clip_name3={clip_name3}, clip_name4={clip_name4}, device={device}, node_id={node_id}")
+        log_debug("EmProps_QuadrupleCLIP_Loader.load_clip called with clip_name1=%s, clip_name2=%s, clip_name3=%s, clip_name4=%s, device=%s, node_id=%s", clip_name1, clip_name2, clip_name3, clip_name4, device, node_id)
         
         if not clip_name1 or not clip_name2 or not clip_name3 or not clip_name4:
             log_debug("EmProps_QuadrupleCLIP_Loader: Missing clip names")
             raise ValueError("All four clip names must be provided")
         
-        # Force refresh the cache to ensure we see the latest files
-        log_debug("EmProps_QuadrupleCLIP_Loader: Refreshing text_encoders cache")
-        if "text_encoders" in folder_paths.filename_list_cache:
-            del folder_paths.filename_list_cache["text_encoders"]
-        
-        # Get the updated file list
-        text_encoder_files = folder_paths.get_filename_list("text_encoders")
-        log_debug(f"EmProps_QuadrupleCLIP_Loader: Available text encoders: {text_encoder_files}")
-        
-        # Check if the files exist with retry logic
+        # Updated: 2026-10-16 - Resolve directly instead of relisting the folder first; missing
+        # files share one wait and the folder is only rescanned on a miss
         max_attempts = 5
-        clip_paths = [None, None, None, None]
         clip_names = [clip_name1, clip_name2, clip_name3, clip_name4]
+        clip_paths = resolve_model_paths("text_encoders", clip_names, max_attempts=max_attempts, log=log_debug)
         
-        for i, clip_name in enumerate(clip_names):
-            attempt = 0
-            while attempt < max_attempts:
-                try:
-                    log_debug(f"EmProps_QuadrupleCLIP_Loader: Attempt {attempt+1} to get path for {clip_name}")
-                    clip_paths[i] = folder_paths.get_full_path("text_encoders", clip_name)
-                    if clip_paths[i]:
-                        log_debug(f"EmProps_QuadrupleCLIP_Loader: Found text encoder at {clip_paths[i]}")
-                        break
-                except Exception as e:
-                    log_debug(f"EmProps_QuadrupleCLIP_Loader: Error getting path: {str(e)}")
-                
-                # If not found, wait a bit and try again (in case it's still being written)
-                log_debug(f"EmProps_QuadrupleCLIP_Loader: Text encoder {clip_name} not found, waiting...")
-                time.sleep(1)
-                
-                # Refresh the cache again
-                if "text_encoders" in folder_paths.filename_list_cache:
-                    del folder_paths.filename_list_cache["text_encoders"]
-                folder_paths.get_filename_list("text_encoders")
-                
-                attempt += 1
-            
-            if not clip_paths[i]:
-                log_debug(f"EmProps_QuadrupleCLIP_Loader: Text encoder {clip_name} not found after {max_attempts} attempts")
+        for clip_name, clip_path in zip(clip_names, clip_paths):
+            if not clip_path:
+                log_debug("EmProps_QuadrupleCLIP_Loader: Text encoder %s not found after %s attempts", clip_name, max_attempts)
                 raise ValueError(f"Text encoder {clip_name} not found after {max_attempts} attempts")
+            log_debug("EmProps_QuadrupleCLIP_Loader: Found text encoder at %s", clip_path)
         
         # Load the clip models
-        log_debug(f"EmProps_QuadrupleCLIP_Loader: Loading text encoders from {clip_paths}")
+        log_debug("EmProps_QuadrupleCLIP_Loader: Loading text encoders from %s", clip_paths)
         try:
             # Send a progress update
             if node_id:
@@ -115,7 +79,7 @@ class EmProps_QuadrupleCLIP_Loader:
             # Load the clip models
             clip = comfy.sd.load_clip(
                 ckpt_paths=[clip_paths[0], clip_paths[1], clip_paths[2], clip_paths[3]], 
-                embedding_directory=folder_paths.get_folder_paths("embeddings"),
+                embedding_directory=get_embedding_directories(),
                 model_options=model_options
             )
             
@@ -127,11 +91,11 @@ class EmProps_QuadrupleCLIP_Loader:
                     "max": 100
                 })
             
-            log_debug(f"EmProps_QuadrupleCLIP_Loader: Successfully loaded text encoders {clip_name1}, {clip_name2}, {clip_name3}, and {clip_name4}")
+            log_debug("EmProps_QuadrupleCLIP_Loader: Successfully loaded text encoders %s, %s, %s, and %s", clip_name1, clip_name2, clip_name3, clip_name4)
             return (clip,)
             
         except Exception as e:
-            log_debug(f"EmProps_QuadrupleCLIP_Loader: Error loading text encoders: {str(e)}")
+            log_debug("EmProps_QuadrupleCLIP_Loader: Error loading text encoders: %s", e)
             raise e
 
 # Node class mappings for ComfyUI
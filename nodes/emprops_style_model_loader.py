@@ -1,11 +1,12 @@
-import os
-import torch
 import folder_paths
 import comfy.sd
-from .. import log_debug  # Updated: 2025-06-02T11:10:11-04:00 - Import from main package
-from comfy.cli_args import args
+from .helpers.log_helper import get_logger, make_log_debug
 from server import PromptServer
 
+# Updated: 2026-10-16 - Shared EmProps logger; no-op unless EMPROPS_DEBUG_LOGGING is set
+logger = get_logger("STYLE_MODEL_LOADER")
+log_debug = make_log_debug(logger)
+
 class EmProps_Style_Model_Loader:
     """
     A custom Style Model loader that explicitly loads files by name,
@@ -31,7 +32,7 @@ class EmProps_Style_Model_Loader:
         }
 
     def load_style_model(self, style_model_name, node_id=None):
-        log_debug(f"EmProps_Style_Model_Loader.load_style_model called with style_model_name={style_model_name}")
+        log_debug("EmProps_Style_Model_Loader.load_style_model called with style_model_name=%s", style_model_name)
         
         if not style_model_name:
             raise ValueError("Style model name cannot be empty")
@@ -67,11 +68,11 @@ class EmProps_Style_Model_Loader:
                     "max": 100
                 })
             
-            log_debug(f"EmProps_Style_Model_Loader: Successfully loaded style model {style_model_name}")
+            log_debug("EmProps_Style_Model_Loader: Successfully loaded style model %s", style_model_name)
             return (style_model,)
             
         except Exception as e:
-            log_debug(f"EmProps_Style_Model_Loader: Error loading style model: {str(e)}")
+            log_debug("EmProps_Style_Model_Loader: Error loading style model: %s", e)
             raise e
 
 # For backwards compatibility with some workflows
@@ -1,13 +1,16 @@
 import os
 import sys
-import boto3  # type: ignore # Will be fixed with types-boto3
 import folder_paths  # type: ignore # Custom module without stubs
 import traceback
 import time
 from dotenv import load_dotenv
 from typing import Optional, Tuple, List, Dict, Any
 from io import BytesIO
-from ..utils import unescape_env_value, S3Handler, GCSHandler, AzureHandler, GCS_AVAILABLE, AZURE_AVAILABLE
+from ..utils import unescape_env_value, get_s3_client, get_s3_handler, get_gcs_handler, get_azure_handler, GCSHandler, AzureHandler, GCS_AVAILABLE, AZURE_AVAILABLE
+
+# Added: 2026-10-16 - Import once at load time instead of on every Azure upload
+if AZURE_AVAILABLE:
+    from azure.storage.blob import ContentSettings
 
 # Added: 2025-04-24T15:20:02-04:00 - Enhanced logging for debugging
 def log_debug(message):
@@ -262,15 +265,12 @@ class EmpropsTextCloudStorageSaver:
                 print(f"[EmProps] Debug - Using AWS Region: {self.aws_region}")
 
                 # Initialize S3 client with explicit credentials
-                s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=self.aws_access_key,
-                    aws_secret_access_key=self.aws_secret_key,
-                    region_name=self.aws_region
-                )
+                # Updated: 2026-10-16 - boto3 is imported on first AWS use
+                # Updated: 2026-10-16 - Shared, pooled client reused across node runs
+                s3_client = get_s3_client(self.aws_access_key, self.aws_region)
                 
                 # Create S3Handler for verification
-                s3_handler = S3Handler(bucket)
+                s3_handler = get_s3_handler(bucket)
             elif provider == "google":
                 if not self.gcs_available:
                     raise ValueError("Google Cloud Storage is not available. Install with 'pip install google-cloud-storage'")
@@ -285,7 +285,7 @@ class EmpropsTextCloudStorageSaver:
                     print("[EmProps] Debug - Using default GCS credentials")
                     
                 # Initialize GCS handler
-                gcs_handler = GCSHandler(bucket)
+                gcs_handler = get_gcs_handler(bucket)
                 
                 # Check if GCS client is initialized
                 if not gcs_handler.gcs_client:
@@ -306,7 +306,7 @@ class EmpropsTextCloudStorageSaver:
                 
                 # Initialize Azure handler
                 log_debug(f"Initializing Azure handler with container: {bucket}")
-                azure_handler = AzureHandler(bucket)
+                azure_handler = get_azure_handler(bucket)
                 
                 # Check if Azure client is initialized
                 if not azure_handler.blob_service_client or not azure_handler.container_client:
@@ -405,7 +405,6 @@ class EmpropsTextCloudStorageSaver:
                     text_bytes.seek(0)
                     
                     # Fixed: 2025-05-07T14:40:00-04:00 - Use ContentSettings object instead of dict
-                    from azure.storage.blob import ContentSettings
                     content_settings = ContentSettings(content_type=content_type)
                     blob_client.upload_blob(
                         text_bytes, 
@@ -1,8 +1,7 @@
 import os
-import boto3
 import folder_paths
 from dotenv import load_dotenv
-from ..utils import unescape_env_value
+from ..utils import unescape_env_value, get_s3_client
 
 class EmProps_Text_S3_Saver:
     """
@@ -97,12 +96,9 @@ class EmProps_Text_S3_Saver:
             print(f"[EmProps] Debug - Using Region: {self.aws_region}")
 
             # Initialize S3 client with explicit credentials
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=self.aws_access_key,
-                aws_secret_access_key=self.aws_secret_key,
-                region_name=self.aws_region
-            )
+            # Updated: 2026-10-16 - boto3 is imported on first use
+            # Updated: 2026-10-16 - Shared, pooled client reused across node runs
+            s3_client = get_s3_client(self.aws_access_key, self.aws_region)
             
             # Ensure prefix ends with '/'
             if not prefix.endswith('/'):
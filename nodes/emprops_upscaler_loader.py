@@ -1,9 +1,8 @@
 import os
-import time
-import traceback
 import logging
 from server import PromptServer
-import folder_paths
+from .helpers.log_helper import get_logger, make_log_debug
+from .helpers.model_path_helper import resolve_model_path
 import comfy.utils
 import torch
 from comfy import model_management
@@ -24,13 +23,9 @@ except ImportError:
     SPANDREL_AVAILABLE = False
 
 # Added: 2025-05-13T16:58:00-04:00 - Custom Upscaler loader implementation
-def log_debug(message):
-    """Enhanced logging function with timestamp and stack info"""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    caller = traceback.extract_stack()[-2]
-    file = os.path.basename(caller.filename)
-    line = caller.lineno
-    print(f"[EmProps DEBUG {timestamp}] [{file}:{line}] {message}", flush=True)
+# Updated: 2026-10-16 - Shared EmProps logger; no-op unless EMPROPS_DEBUG_LOGGING is set
+logger = get_logger("UPSCALER_LOADER")
+log_debug = make_log_debug(logger)
 
 class EmProps_Load_Upscale_Model:
     """
@@ -60,53 +55,23 @@ class EmProps_Load_Upscale_Model:
         }
 
     def load_upscaler(self, upscaler_name, node_id=None):
-        log_debug(f"EmProps_Load_Upscale_Model.load_upscaler called with upscaler_name={upscaler_name}, node_id={node_id}")
+        log_debug("EmProps_Load_Upscale_Model.load_upscaler called with upscaler_name=%s, node_id=%s", upscaler_name, node_id)
         
         if not upscaler_name:
             log_debug("EmProps_Load_Upscale_Model: No upscaler name provided")
             raise ValueError("No upscaler name provided")
         
-        # Force refresh the cache to ensure we see the latest files
-        log_debug("EmProps_Load_Upscale_Model: Refreshing upscaler cache")
-        if "upscale_models" in folder_paths.filename_list_cache:
-            del folder_paths.filename_list_cache["upscale_models"]
-        
-        # Get the updated file list
-        upscaler_files = folder_paths.get_filename_list("upscale_models")
-        log_debug(f"EmProps_Load_Upscale_Model: Available upscalers: {upscaler_files}")
-        
-        # Check if the file exists
+        # Updated: 2026-10-16 - Resolve directly instead of relisting the folder first; the folder
+        # is only rescanned if the file is missing
         max_attempts = 5
-        attempt = 0
-        upscaler_path = None
-        
-        while attempt < max_attempts:
-            try:
-                log_debug(f"EmProps_Load_Upscale_Model: Attempt {attempt+1} to get path for {upscaler_name}")
-                upscaler_path = folder_paths.get_full_path("upscale_models", upscaler_name)
-                if upscaler_path and os.path.exists(upscaler_path):
-                    log_debug(f"EmProps_Load_Upscale_Model: Found upscaler at {upscaler_path}")
-                    break
-            except Exception as e:
-                log_debug(f"EmProps_Load_Upscale_Model: Error getting path: {str(e)}")
-                
-            # If not found, wait a bit and try again (in case it's still being written)
-            log_debug(f"EmProps_Load_Upscale_Model: Upscaler {upscaler_name} not found, waiting...")
-            time.sleep(1)
-            
-            # Refresh the cache again
-            if "upscale_models" in folder_paths.filename_list_cache:
-                del folder_paths.filename_list_cache["upscale_models"]
-            folder_paths.get_filename_list("upscale_models")
-            
-            attempt += 1
+        upscaler_path = resolve_model_path("upscale_models", upscaler_name, max_attempts=max_attempts, log=log_debug)
         
         if not upscaler_path or not os.path.exists(upscaler_path):
-            log_debug(f"EmProps_Load_Upscale_Model: Upscaler {upscaler_name} not found after {max_attempts} attempts")
+            log_debug("EmProps_Load_Upscale_Model: Upscaler %s not found after %s attempts", upscaler_name, max_attempts)
             raise ValueError(f"Upscaler {upscaler_name} not found after {max_attempts} attempts")
         
         # Load the upscaler
-        log_debug(f"EmProps_Load_Upscale_Model: Loading upscaler from {upscaler_path}")
+        log_debug("EmProps_Load_Upscale_Model: Loading upscaler from %s", upscaler_path)
         try:
             # Send a progress update
             if node_id:
@@ -147,11 +112,11 @@ class EmProps_Load_Upscale_Model:
                     "max": 100
                 })
             
-            log_debug(f"EmProps_Load_Upscale_Model: Successfully loaded upscaler {upscaler_name}")
+            log_debug("EmProps_Load_Upscale_Model: Successfully loaded upscaler %s", upscaler_name)
             return (out, )
             
         except Exception as e:
-            log_debug(f"EmProps_Load_Upscale_Model: Error loading upscaler: {str(e)}")
+            log_debug("EmProps_Load_Upscale_Model: Error loading upscaler: %s", e)
             raise e
 
 # Flag: 2025-06-04 18:55 - Added ImageUpscaleWithModel node for convenience
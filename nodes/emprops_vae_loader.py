@@ -1,19 +1,13 @@
-import os
-import time
-import traceback
 from server import PromptServer
-import folder_paths
+from .helpers.log_helper import get_logger, make_log_debug
+from .helpers.model_path_helper import resolve_model_path
 import comfy.sd
 import comfy.utils  # Added: 2025-05-30T10:56:43-04:00 - For loading torch files
 
 # Added: 2025-05-13T16:56:15-04:00 - Custom VAE loader implementation
-def log_debug(message):
-    """Enhanced logging function with timestamp and stack info"""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    caller = traceback.extract_stack()[-2]
-    file = os.path.basename(caller.filename)
-    line = caller.lineno
-    print(f"[EmProps DEBUG {timestamp}] [{file}:{line}] {message}", flush=True)
+# Updated: 2026-10-16 - Shared EmProps logger; no-op unless EMPROPS_DEBUG_LOGGING is set
+logger = get_logger("VAE_LOADER")
+log_debug = make_log_debug(logger)
 
 class EmProps_VAE_Loader:
     """
@@ -40,53 +34,23 @@ class EmProps_VAE_Loader:
         }
 
     def load_vae(self, vae_name, node_id=None):
-        log_debug(f"EmProps_VAE_Loader.load_vae called with vae_name={vae_name}, node_id={node_id}")
+        log_debug("EmProps_VAE_Loader.load_vae called with vae_name=%s, node_id=%s", vae_name, node_id)
         
         if not vae_name:
             log_debug("EmProps_VAE_Loader: No VAE name provided")
             raise ValueError("No VAE name provided")
         
-        # Force refresh the cache to ensure we see the latest files
-        log_debug("EmProps_VAE_Loader: Refreshing VAE cache")
-        if "vae" in folder_paths.filename_list_cache:
-            del folder_paths.filename_list_cache["vae"]
-        
-        # Get the updated file list
-        vae_files = folder_paths.get_filename_list("vae")
-        log_debug(f"EmProps_VAE_Loader: Available VAEs: {vae_files}")
-        
-        # Check if the file exists
+        # Updated: 2026-10-16 - Resolve directly instead of relisting the folder first; the folder
+        # is only rescanned if the file is missing
         max_attempts = 5
-        attempt = 0
-        vae_path = None
-        
-        while attempt < max_attempts:
-            try:
-                log_debug(f"EmProps_VAE_Loader: Attempt {attempt+1} to get path for {vae_name}")
-                vae_path = folder_paths.get_full_path("vae", vae_name)
-                if vae_path:
-                    log_debug(f"EmProps_VAE_Loader: Found VAE at {vae_path}")
-                    break
-            except Exception as e:
-                log_debug(f"EmProps_VAE_Loader: Error getting path: {str(e)}")
-                
-            # If not found, wait a bit and try again (in case it's still being written)
-            log_debug(f"EmProps_VAE_Loader: VAE {vae_name} not found, waiting...")
-            time.sleep(1)
-            
-            # Refresh the cache again
-            if "vae" in folder_paths.filename_list_cache:
-                del folder_paths.filename_list_cache["vae"]
-            folder_paths.get_filename_list("vae")
-            
-            attempt += 1
+        vae_path = resolve_model_path("vae", vae_name, max_attempts=max_attempts, log=log_debug)
         
         if not vae_path:
-            log_debug(f"EmProps_VAE_Loader: VAE {vae_name} not found after {max_attempts} attempts")
+            log_debug("EmProps_VAE_Loader: VAE %s not found after %s attempts", vae_name, max_attempts)
             raise ValueError(f"VAE {vae_name} not found after {max_attempts} attempts")
         
         # Load the VAE
-        log_debug(f"EmProps_VAE_Loader: Loading VAE from {vae_path}")
+        log_debug("EmProps_VAE_Loader: Loading VAE from %s", vae_path)
         try:
             # Send a progress update
             if node_id:
@@ -110,11 +74,11 @@ class EmProps_VAE_Loader:
                     "max": 100
                 })
             
-            log_debug(f"EmProps_VAE_Loader: Successfully loaded VAE {vae_name}")
+            log_debug("EmProps_VAE_Loader: Successfully loaded VAE %s", vae_name)
             return (vae,)
             
         except Exception as e:
-            log_debug(f"EmProps_VAE_Loader: Error loading VAE: {str(e)}")
+            log_debug("EmProps_VAE_Loader: Error loading VAE: %s", e)
             raise e
 
 # Node class mappings for ComfyUI
@@ -1,3 +1,12 @@
-from .image_save_helper import ImageSaveHelper
+from .image_save_helper import ImageSaveHelper, json_dumps, write_file_bytes
+from .log_helper import get_logger
+from .model_path_helper import resolve_model_path, resolve_model_paths, wait_for_model_file
+from .loaded_model_cache import LoadedModelCache, loaded_model_cache, install_comfy_memory_hooks
+from .download_helper import download_ranged
 
-__all__ = ['ImageSaveHelper']
+__all__ = [
+    'ImageSaveHelper', 'json_dumps', 'write_file_bytes', 'get_logger',
+    'resolve_model_path', 'resolve_model_paths', 'wait_for_model_file',
+    'LoadedModelCache', 'loaded_model_cache', 'install_comfy_memory_hooks',
+    'download_ranged',
+]
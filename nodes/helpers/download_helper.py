@@ -0,0 +1,58 @@
+# Added: 2026-10-16 - Parallel ranged HTTP downloads for the asset downloader
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Bytes read from each response per iteration
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def download_ranged(session, url, headers, path, total_size, on_progress, parts=8, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Download url into path as parallel ranged GETs written in place with os.pwrite.
+
+    Args:
+        session: requests.Session (or compatible) used for every part
+        url (str): Source URL (the server must accept byte ranges)
+        headers (dict): Request headers (auth etc.), sent with every part
+        path (str): Destination file; created and preallocated to total_size
+        total_size (int): Content-Length of the resource
+        on_progress: Called with the byte count of each written chunk, from worker threads
+        parts (int): Number of concurrent ranges
+        chunk_size (int): Bytes read from each response per iteration
+
+    Raises:
+        IOError: If the server ignores the range or a part is shorter or longer than requested
+    """
+    part_size = -(-total_size // parts)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, 0, total_size)
+            except OSError:
+                pass
+
+        def fetch(start, end):
+            part_headers = dict(headers)
+            part_headers["Range"] = f"bytes={start}-{end}"
+            with session.get(url, headers=part_headers, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise IOError(f"Server ignored range request for {url} (status {response.status_code})")
+                offset = start
+                for data in response.iter_content(chunk_size=chunk_size):
+                    # Never write past this part's range into the next one
+                    if offset + len(data) > end + 1:
+                        raise IOError(f"Range {start}-{end} for {url} returned more data than requested")
+                    os.pwrite(fd, data, offset)
+                    offset += len(data)
+                    on_progress(len(data))
+            if offset != end + 1:
+                raise IOError(f"Incomplete range {start}-{end} for {url}: got {offset - start} bytes")
+
+        ranges = [(start, min(start + part_size, total_size) - 1) for start in range(0, total_size, part_size)]
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            for future in [executor.submit(fetch, start, end) for start, end in ranges]:
+                future.result()
+    finally:
+        os.close(fd)
@@ -1,10 +1,125 @@
 import os
 import json
-import numpy as np
+import threading
+import torch
 from PIL import Image
 from PIL.PngImagePlugin import PngInfo
 import io
 
+# Added: 2026-10-16 - Optional orjson for serialising large workflow metadata
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(obj):
+    """
+    Serialise metadata to a JSON string, using orjson when it is installed.
+
+    Falls back to the standard library for values orjson rejects
+    (e.g. non-string keys or integers wider than 64 bits).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+
+# Added: 2026-10-16 - Optional libvips PNG encoder for the cloud upload path
+try:
+    import pyvips  # type: ignore
+    PYVIPS_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError: the Python binding is installed but libvips itself is missing
+    PYVIPS_AVAILABLE = False
+
+
+# Added: 2026-10-16 - Write an already-encoded image straight to disk
+def write_file_bytes(path, data):
+    """
+    Write an in-memory buffer to a file with a single low-level write loop.
+
+    Uses O_NOATIME where the platform supports it and falls back to a plain
+    open() when the flag is rejected (e.g. the file is owned by another user).
+
+    Args:
+        path (str): Destination file path
+        data: bytes, bytearray or memoryview (e.g. BytesIO.getbuffer())
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    noatime = getattr(os, 'O_NOATIME', 0)
+    try:
+        fd = os.open(path, flags | noatime, 0o644)
+    except OSError:
+        if not noatime:
+            raise
+        fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data).cast('B')
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+# Added: 2026-10-16 - Producer/consumer pipe used for streaming uploads
+class EncodeStream:
+    """
+    Readable end of an os.pipe fed by an encoder running on a daemon thread.
+    
+    An error raised by the encoder is re-raised from read() once the pipe
+    reaches EOF, so a failed encode never looks like a short, valid file.
+    """
+    
+    def __init__(self, encode):
+        """
+        Args:
+            encode: Callable taking a writable binary file object
+        """
+        read_fd, write_fd = os.pipe()
+        self._reader = os.fdopen(read_fd, 'rb')
+        self._error = None
+        self._thread = threading.Thread(target=self._run, args=(encode, os.fdopen(write_fd, 'wb')), daemon=True)
+        self._thread.start()
+    
+    def _run(self, encode, writer):
+        try:
+            with writer:
+                encode(writer)
+        except BaseException as e:
+            # BrokenPipeError lands here too when the reader is closed early
+            self._error = e
+    
+    def read(self, size=-1):
+        data = self._reader.read(size)
+        if not data:
+            self._thread.join()
+            if self._error is not None:
+                raise self._error
+        return data
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return False
+    
+    def close(self):
+        self._reader.close()
+        self._thread.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class ImageSaveHelper:
     """
     Helper class for processing and saving images in a format compatible with ComfyUI's default implementation.
@@ -20,7 +135,7 @@ class ImageSaveHelper:
         """
         self.compress_level = compress_level
 
-    def process_images(self, images, prompt=None, extra_pnginfo=None, format="PNG", mime_type="image/png"):
+    def process_images(self, images, prompt=None, extra_pnginfo=None, format="PNG", mime_type="image/png", compress_level=None):
         """
         Process a batch of images and convert them to bytes with metadata.
         
@@ -30,40 +145,115 @@ class ImageSaveHelper:
             extra_pnginfo: Optional additional metadata
             format: Image format to save as (default: "PNG")
             mime_type: MIME type for the image (default: "image/png")
+            compress_level: Optional PNG compression level overriding the helper default
             
         Returns:
             List of tuples (bytes_io, metadata, mime_type) for each processed image
         """
         results = []
+        if compress_level is None:
+            compress_level = self.compress_level
+        
+        # Updated: 2026-10-16 - Metadata is identical for every image in the batch, build it once
+        text_chunks = self._metadata_items(prompt, extra_pnginfo)
+        if mime_type:
+            text_chunks.append(("mime_type", mime_type))
+        metadata = PngInfo()
+        for key, value in text_chunks:
+            metadata.add_text(key, value)
         
         for image in images:
-            # Convert tensor to numpy array and scale to 0-255 range
-            i = 255. * image.cpu().numpy()
-            # Clip values and convert to uint8
-            img = Image.fromarray(np.clip(i, 0, 255).astype(np.uint8))
+            arr = self._to_uint8_array(image)
+            img = Image.fromarray(arr)
             
-            # Create metadata if enabled
-            metadata = self._create_metadata(prompt, extra_pnginfo)
-            if mime_type:
-                metadata.add_text("mime_type", mime_type)
+            # Added: 2026-10-16 - libvips encodes large PNGs considerably faster than Pillow
+            if format.upper() == "PNG" and PYVIPS_AVAILABLE:
+                try:
+                    img_bytes = io.BytesIO(self._encode_png_pyvips(arr, text_chunks, compress_level))
+                    results.append((img_bytes, metadata, mime_type))
+                    continue
+                except Exception as e:
+                    print(f"[EmProps] pyvips PNG encode failed, falling back to Pillow: {str(e)}")
             
             # Convert to bytes
             img_bytes = io.BytesIO()
-            save_kwargs = {"format": format}
-            if format.upper() == "PNG":
-                save_kwargs["compress_level"] = self.compress_level
-                save_kwargs["pnginfo"] = metadata
-            elif format.upper() in ["JPEG", "JPG"]:
-                save_kwargs["quality"] = 95
-                save_kwargs["exif"] = metadata
-            
-            img.save(img_bytes, **save_kwargs)
+            self._save_pil(img, img_bytes, metadata, format, compress_level)
             img_bytes.seek(0)
             
             results.append((img_bytes, metadata, mime_type))
         
         return results
     
+    # Added: 2026-10-16 - Encode a single image into any writable file object
+    def encode_image(self, image, fp, prompt=None, extra_pnginfo=None, format="PNG", mime_type="image/png", compress_level=None):
+        """
+        Encode one image tensor with metadata into a writable file object.
+        
+        Args:
+            image: Tensor image from ComfyUI
+            fp: Writable binary file object (BytesIO, file, pipe)
+            prompt: Optional prompt information to include in metadata
+            extra_pnginfo: Optional additional metadata
+            format: Image format to save as (default: "PNG")
+            mime_type: MIME type for the image (default: "image/png")
+            compress_level: Optional PNG compression level overriding the helper default
+        """
+        if compress_level is None:
+            compress_level = self.compress_level
+        img = Image.fromarray(self._to_uint8_array(image))
+        metadata = self._create_metadata(prompt, extra_pnginfo)
+        if mime_type:
+            metadata.add_text("mime_type", mime_type)
+        self._save_pil(img, fp, metadata, format, compress_level)
+    
+    # Added: 2026-10-16 - Stream an encode into a reader without buffering the whole file
+    def open_encode_stream(self, image, prompt=None, extra_pnginfo=None, format="PNG", mime_type="image/png", compress_level=None):
+        """
+        Start encoding an image on a background thread and return a readable stream of its bytes.
+        
+        The encoder writes into an os.pipe, so a consumer such as boto3's
+        upload_fileobj can send early parts while later ones are still being
+        encoded. The stream is not seekable.
+        
+        Returns:
+            EncodeStream: Read it to EOF, then close it
+        """
+        return EncodeStream(lambda fp: self.encode_image(
+            image, fp,
+            prompt=prompt,
+            extra_pnginfo=extra_pnginfo,
+            format=format,
+            mime_type=mime_type,
+            compress_level=compress_level
+        ))
+    
+    # Added: 2026-10-16 - Scale/clip/cast in torch so only uint8 data is copied into numpy
+    def _to_uint8_array(self, image):
+        """
+        Convert a 0-1 float image tensor to a contiguous HxWxC uint8 numpy array.
+        
+        clamp() is out of place (the input tensor is shared with other nodes),
+        after which mul_ and the uint8 cast reuse that temporary. .cpu() is a
+        no-op for CPU tensors and .numpy() then views the uint8 storage, so
+        no float32 copy is made on the numpy side.
+        """
+        t = image.clamp(0, 1).mul_(255).to(torch.uint8)
+        if t.device.type != "cpu":
+            t = t.cpu()
+        return t.contiguous().numpy()
+    
+    def _save_pil(self, img, fp, metadata, format, compress_level):
+        """Save a PIL image to fp with the format specific options used by this helper"""
+        save_kwargs = {"format": format}
+        if format.upper() == "PNG":
+            save_kwargs["compress_level"] = compress_level
+            save_kwargs["pnginfo"] = metadata
+        elif format.upper() in ["JPEG", "JPG"]:
+            save_kwargs["quality"] = 95
+            save_kwargs["exif"] = metadata
+        
+        img.save(fp, **save_kwargs)
+    
     def _create_metadata(self, prompt=None, extra_pnginfo=None):
         """
         Create PNG metadata matching ComfyUI's format.
@@ -77,14 +267,52 @@ class ImageSaveHelper:
         """
         metadata = PngInfo()
         
+        for key, value in self._metadata_items(prompt, extra_pnginfo):
+            metadata.add_text(key, value)
+                
+        return metadata
+    
+    # Added: 2026-10-16 - Text chunks shared by the Pillow and pyvips encoders
+    def _metadata_items(self, prompt=None, extra_pnginfo=None):
+        """
+        Build the (key, text) pairs written as PNG text chunks.
+        
+        Args:
+            prompt: Optional prompt information
+            extra_pnginfo: Optional additional metadata
+            
+        Returns:
+            List of (key, json_string) tuples
+        """
+        items = []
+        
         if prompt is not None:
-            metadata.add_text("prompt", json.dumps(prompt))
+            items.append(("prompt", json_dumps(prompt)))
             
         if extra_pnginfo is not None:
             for key in extra_pnginfo:
-                metadata.add_text(key, json.dumps(extra_pnginfo[key]))
+                items.append((key, json_dumps(extra_pnginfo[key])))
                 
-        return metadata
+        return items
+    
+    # Added: 2026-10-16 - PNG encode through libvips
+    def _encode_png_pyvips(self, arr, text_chunks, compress_level):
+        """
+        Encode a uint8 HxWxC array to PNG bytes with pyvips.
+        
+        Args:
+            arr: C-contiguous uint8 numpy array
+            text_chunks: List of (key, text) pairs written as PNG text chunks
+            compress_level (int): zlib compression level (0-9)
+            
+        Returns:
+            bytes: Encoded PNG
+        """
+        vi = pyvips.Image.new_from_array(arr).copy(interpretation="srgb")
+        # libvips writes "png-comment-<index>-<key>" fields as tEXt chunks
+        for index, (key, value) in enumerate(text_chunks):
+            vi.set_type(pyvips.GValue.gstr_type, f"png-comment-{index}-{key}", value)
+        return vi.pngsave_buffer(compression=compress_level)
     
     def format_ui_response(self, filenames, subfolder="", type="output"):
         """
@@ -0,0 +1,202 @@
+# Added: 2026-10-16 - Reuse loaded model objects across prompts while the file is unchanged
+import os
+import threading
+from collections import OrderedDict
+
+# Optional: system RAM headroom check (psutil ships with ComfyUI)
+try:
+    import psutil  # type: ignore
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Number of loaded models kept alive; 0 disables the cache
+DEFAULT_CACHE_SIZE = 2
+
+# Added: 2026-10-16 - Cached models are dropped (oldest first) while free RAM is below this
+DEFAULT_MIN_FREE_RAM_MB = 4096
+
+
+def _cache_size_from_env():
+    try:
+        return max(0, int(os.environ.get('EMPROPS_MODEL_CACHE_SIZE', DEFAULT_CACHE_SIZE)))
+    except ValueError:
+        return DEFAULT_CACHE_SIZE
+
+
+def _min_free_ram_from_env():
+    try:
+        return max(0, int(os.environ.get('EMPROPS_MODEL_CACHE_MIN_FREE_RAM_MB', DEFAULT_MIN_FREE_RAM_MB))) * 1024 * 1024
+    except ValueError:
+        return DEFAULT_MIN_FREE_RAM_MB * 1024 * 1024
+
+
+def _free_ram_bytes():
+    """Available system RAM in bytes, or None when it cannot be measured"""
+    if not PSUTIL_AVAILABLE:
+        return None
+    return psutil.virtual_memory().available
+
+
+class LoadedModelCache:
+    """
+    Small LRU of objects returned by comfy loaders (MODEL, CLIP, CONTROL_NET, ...).
+
+    Entries are keyed on the loader kind, each file's absolute path, mtime and
+    size, and the load options, so a re-downloaded or replaced file is loaded
+    fresh. Returned objects are shared; ComfyUI's ModelPatcher clones before
+    patching, the same way its own node output cache shares them.
+
+    Entries are released when ComfyUI unloads all models and whenever free RAM
+    drops below min_free_ram (see install_comfy_memory_hooks).
+    """
+
+    def __init__(self, max_size=None, min_free_ram=None, free_ram=_free_ram_bytes):
+        self.max_size = _cache_size_from_env() if max_size is None else max_size
+        self.min_free_ram = _min_free_ram_from_env() if min_free_ram is None else min_free_ram
+        self._free_ram = free_ram
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Added: 2026-10-16 - Per-key locks so concurrent misses on one key load it once
+        self._loading = {}
+
+    @staticmethod
+    def _file_key(path):
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _options_key(options):
+        # Options hold torch dtypes/devices; repr keeps the key hashable and stable
+        return tuple(sorted((str(k), repr(v)) for k, v in (options or {}).items()))
+
+    def _get_locked(self, key, kind, paths, log):
+        """Return (True, value) on a hit; caller holds self._lock"""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            if log:
+                log("Model cache hit for %s: %s", kind, paths)
+            return True, self._entries[key]
+        return False, None
+
+    def get_or_load(self, kind, paths, options, load, log=None):
+        """
+        Return the cached object for these files and options, loading it on a miss.
+
+        Args:
+            kind (str): Loader identifier, e.g. "checkpoint"
+            paths (list): Model file paths the object is built from
+            options (dict): Options that change the loaded result
+            load: Zero-argument callable performing the actual load
+            log: Optional log_debug-style callable
+
+        Returns:
+            Whatever load() returns
+        """
+        if self.max_size <= 0:
+            return load()
+
+        key = (kind, tuple(self._file_key(p) for p in paths), self._options_key(options))
+        with self._lock:
+            hit, value = self._get_locked(key, kind, paths, log)
+            if hit:
+                return value
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        # Load outside the cache lock so other keys stay available; a second miss on the same
+        # key waits for the first load and then takes it from the cache
+        try:
+            with key_lock:
+                with self._lock:
+                    hit, value = self._get_locked(key, kind, paths, log)
+                if hit:
+                    return value
+                value = load()
+                # Fixed: 2026-10-16 - A failed load returning None must not stick until the file changes
+                if value is None:
+                    return value
+                with self._lock:
+                    self._entries[key] = value
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_size:
+                        self._evict_oldest_locked(log)
+        finally:
+            with self._lock:
+                if self._loading.get(key) is key_lock and not key_lock.locked():
+                    del self._loading[key]
+
+        self.ensure_headroom(log)
+        return value
+
+    def _evict_oldest_locked(self, log=None):
+        evicted_key, _ = self._entries.popitem(last=False)
+        if log:
+            log("Model cache evicted %s: %s", evicted_key[0], [f[0] for f in evicted_key[1]])
+
+    def ensure_headroom(self, log=None):
+        """
+        Drop cached models, oldest first, while free system RAM is below min_free_ram.
+
+        Returns:
+            int: Number of entries evicted
+        """
+        evicted = 0
+        with self._lock:
+            while self._entries:
+                free = self._free_ram()
+                if free is None or free >= self.min_free_ram:
+                    break
+                self._evict_oldest_locked(log)
+                evicted += 1
+        return evicted
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        """Drop every cached model reference"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all EmProps loaders
+loaded_model_cache = LoadedModelCache()
+
+
+# Added: 2026-10-16 - Let ComfyUI reclaim memory held by the cache
+def install_comfy_memory_hooks(cache=None):
+    """
+    Wrap comfy.model_management.unload_all_models and free_memory.
+
+    unload_all_models (the /free endpoint, "Unload models" in the UI) also
+    clears the cache; free_memory (run before every model load) also runs
+    the RAM headroom check. Safe to call more than once.
+
+    Returns:
+        bool: True when the hooks are installed
+    """
+    cache = loaded_model_cache if cache is None else cache
+    try:
+        import comfy.model_management as model_management  # type: ignore
+    except ImportError:
+        return False
+
+    original_unload = model_management.unload_all_models
+    if not getattr(original_unload, '_emprops_hooked', False):
+        def unload_all_models(*args, **kwargs):
+            cache.clear()
+            return original_unload(*args, **kwargs)
+        unload_all_models._emprops_hooked = True
+        model_management.unload_all_models = unload_all_models
+
+    original_free = model_management.free_memory
+    if not getattr(original_free, '_emprops_hooked', False):
+        def free_memory(*args, **kwargs):
+            result = original_free(*args, **kwargs)
+            cache.ensure_headroom()
+            return result
+        free_memory._emprops_hooked = True
+        model_management.free_memory = free_memory
+
+    return True
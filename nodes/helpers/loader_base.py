@@ -0,0 +1,92 @@
+# Added: 2026-10-16 - Shared body of the EmProps model loaders
+import contextlib
+from server import PromptServer  # type: ignore # Custom module without stubs
+from .model_path_helper import resolve_model_paths, hint_willneed
+from .loaded_model_cache import loaded_model_cache, install_comfy_memory_hooks
+
+# Added: 2026-10-16 - Cached models are released when ComfyUI unloads or runs low on RAM
+install_comfy_memory_hooks(loaded_model_cache)
+
+
+class EmPropsLoaderBase:
+    """
+    Resolve model names to paths, report progress and load through the shared
+    model cache. Subclasses set FOLDER_KEY, LABEL and CACHE_KIND, implement
+    _call_loader and call _resolve_and_load from their FUNCTION.
+    """
+    FOLDER_KEY = None
+    LABEL = "Model"
+    CACHE_KIND = None
+    MAX_ATTEMPTS = 5
+
+    # Subclasses bind their module's log_debug with staticmethod(log_debug)
+    log = staticmethod(lambda message, *args, **kwargs: None)
+
+    def _call_loader(self, paths, **options):
+        """Load and return the node output for the resolved paths"""
+        raise NotImplementedError
+
+    # Updated: 2026-10-16 - All names are resolved together so missing files share one wait
+    def _resolve_paths(self, names):
+        """Resolve every file name in FOLDER_KEY or raise ValueError for the first missing one"""
+        node = type(self).__name__
+        paths = resolve_model_paths(self.FOLDER_KEY, names, max_attempts=self.MAX_ATTEMPTS, log=self.log)
+        for name, path in zip(names, paths):
+            if not path:
+                self.log("%s: %s %s not found after %s attempts", node, self.LABEL, name, self.MAX_ATTEMPTS)
+                raise ValueError(f"{self.LABEL} {name} not found after {self.MAX_ATTEMPTS} attempts")
+            self.log("%s: Found %s at %s", node, self.LABEL, path)
+        return paths
+
+    def _send_progress(self, node_id, value):
+        if node_id:
+            PromptServer.instance.send_sync("progress", {
+                "node": node_id,
+                "value": value,
+                "max": 100
+            })
+
+    # Updated: 2026-10-16 - Only the completion message is sent; the 0% one carried no information
+    # (ComfyUI already marks the node as running) and each send_sync wakes every client
+    # Fixed: 2026-10-16 - The completion message is also sent when the load raises, so the UI
+    # progress bar is never left part way
+    @contextlib.contextmanager
+    def _with_progress(self, node_id):
+        try:
+            yield
+        finally:
+            self._send_progress(node_id, 100)
+
+    def _resolve_and_load(self, names, node_id=None, **options):
+        """
+        Resolve every name, then load through the model cache with progress reporting.
+
+        Args:
+            names (list): File names relative to FOLDER_KEY
+            node_id: Optional node id for progress messages
+            **options: Passed to _call_loader; also part of the cache key
+
+        Returns:
+            The value returned by _call_loader (or its cached copy)
+        """
+        node = type(self).__name__
+        paths = self._resolve_paths(names)
+
+        def load():
+            # Added: 2026-10-16 - Read-ahead overlaps with comfy's setup; only on a cache miss
+            for path in paths:
+                hint_willneed(path)
+            return self._call_loader(paths, **options)
+
+        self.log("%s: Loading %s from %s with options %s", node, self.LABEL, paths, options)
+        try:
+            with self._with_progress(node_id):
+                result = loaded_model_cache.get_or_load(
+                    self.CACHE_KIND, paths, options, load,
+                    log=self.log
+                )
+            self.log("%s: Successfully loaded %s %s", node, self.LABEL, names)
+            return result
+        except Exception as e:
+            self.log("%s: Error loading %s: %s", node, self.LABEL, e)
+            raise e
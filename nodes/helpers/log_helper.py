@@ -0,0 +1,78 @@
+# Added: 2026-10-16 - Shared logging setup for EmProps nodes
+import os
+import logging
+
+# Package-wide debug switch, same variable the print-based log_debug helpers read
+DEBUG_LOGGING = os.environ.get('EMPROPS_DEBUG_LOGGING', '').lower() in ('1', 'true', 'yes', 'on')
+
+_ROOT_LOGGER_NAME = "emprops"
+
+
+def _configure_root_logger():
+    """
+    Attach a single stream handler to the "emprops" logger.
+
+    Output keeps the familiar "[EmProps <NAME> <timestamp>] [file:line] message"
+    layout. The level is DEBUG only when EMPROPS_DEBUG_LOGGING is set, so
+    disabled debug calls return before any message formatting.
+    """
+    root = logging.getLogger(_ROOT_LOGGER_NAME)
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            "[EmProps %(emprops_tag)s %(asctime)s] [%(filename)s:%(lineno)d] %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        ))
+        handler.addFilter(_TagFilter())
+        root.addHandler(handler)
+        # ComfyUI configures the root logger; keep our lines from being printed twice
+        root.propagate = False
+    root.setLevel(logging.DEBUG if DEBUG_LOGGING else logging.INFO)
+    return root
+
+
+class _TagFilter(logging.Filter):
+    """Expose the child logger name (e.g. CLOUD_STORAGE_SAVER) as %(emprops_tag)s"""
+
+    def filter(self, record):
+        record.emprops_tag = record.name.rsplit(".", 1)[-1]
+        return True
+
+
+def get_logger(tag):
+    """
+    Return the logger for one module, e.g. get_logger("CLOUD_STORAGE_SAVER").
+
+    Args:
+        tag (str): Short upper-case module tag shown in each line
+
+    Returns:
+        logging.Logger: Child of the shared "emprops" logger
+    """
+    _configure_root_logger()
+    return logging.getLogger(f"{_ROOT_LOGGER_NAME}.{tag}")
+
+
+# Added: 2026-10-16 - Per-module log_debug that costs nothing when debug output is off
+def make_log_debug(logger):
+    """
+    Build a log_debug(message, *args, **kwargs) function for a module logger.
+
+    When EMPROPS_DEBUG_LOGGING is off this returns a no-op, so call sites pay
+    only for the call itself; pass values as %-style args rather than
+    f-strings so nothing is formatted either.
+
+    Args:
+        logger (logging.Logger): Logger from get_logger
+
+    Returns:
+        callable: log_debug function
+    """
+    if not DEBUG_LOGGING:
+        def log_debug(message, *args, **kwargs):
+            pass
+        return log_debug
+
+    def log_debug(message, *args, **kwargs):
+        logger.debug(message, *args, stacklevel=2, **kwargs)
+    return log_debug
@@ -0,0 +1,260 @@
+# Added: 2026-10-16 - Shared model path resolution for the EmProps loaders
+import os
+import time
+import functools
+import threading
+import folder_paths  # type: ignore # Custom module without stubs
+
+# Added: 2026-10-16 - Optional filesystem event backends for waiting on in-flight downloads
+try:
+    from inotify_simple import INotify, flags as inotify_flags  # type: ignore
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+try:
+    from watchdog.observers import Observer  # type: ignore
+    from watchdog.events import FileSystemEventHandler  # type: ignore
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Poll interval used only when neither event backend is installed
+POLL_INTERVAL_SECONDS = 0.2
+
+# Seconds during which a second miss for the same folder reuses the last rescan
+REFRESH_COALESCE_SECONDS = 2.0
+
+_last_refresh_ts = {}
+_refresh_lock = threading.Lock()
+
+
+def refresh_filename_list(folder_key, force=False):
+    """
+    Drop ComfyUI's cached file list for a folder and rescan it.
+
+    Misses from several loaders in the same prompt usually arrive within a
+    moment of each other; a rescan done less than REFRESH_COALESCE_SECONDS
+    ago is reused unless force is set.
+
+    Args:
+        folder_key (str): folder_paths key, e.g. "checkpoints"
+        force (bool): Rescan even if a recent rescan happened
+
+    Returns:
+        bool: True if a rescan was performed
+    """
+    with _refresh_lock:
+        now = time.monotonic()
+        last = _last_refresh_ts.get(folder_key)
+        if not force and last is not None and now - last < REFRESH_COALESCE_SECONDS:
+            return False
+        folder_paths.filename_list_cache.pop(folder_key, None)
+        folder_paths.get_filename_list(folder_key)
+        _last_refresh_ts[folder_key] = time.monotonic()
+        return True
+
+
+# Added: 2026-10-16 - Embedding search paths are fixed once ComfyUI has read its model path config
+@functools.lru_cache(maxsize=1)
+def get_embedding_directories():
+    """
+    Return the configured "embeddings" folders, computed once per process.
+
+    Returns:
+        list: Embedding directories to pass as embedding_directory to comfy loaders
+    """
+    return folder_paths.get_folder_paths("embeddings")
+
+
+# Added: 2026-10-16 - Start kernel read-ahead while Python sets up the load
+def hint_willneed(path):
+    """
+    Ask the kernel to start reading a file into the page cache (POSIX_FADV_WILLNEED)
+    and to use sequential read-ahead for it (POSIX_FADV_SEQUENTIAL).
+
+    Fire-and-forget: a no-op where posix_fadvise is unavailable, and errors
+    are ignored because nothing depends on the hint.
+
+    Args:
+        path (str): File that is about to be read
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        # Added: 2026-10-16 - Loaders read the whole file front to back; SEQUENTIAL widens the
+        # kernel's read-ahead window for the part WILLNEED hasn't fetched yet
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _candidate_dirs(folder_key, name):
+    """Existing directories a model file of this name could appear in"""
+    dirs = []
+    for base in folder_paths.get_folder_paths(folder_key):
+        directory = os.path.dirname(os.path.join(base, name))
+        if os.path.isdir(directory) and directory not in dirs:
+            dirs.append(directory)
+    return dirs
+
+
+def _lookup(folder_key, name, log=None):
+    try:
+        return folder_paths.get_full_path(folder_key, name)
+    except Exception as e:
+        if log:
+            log("Error getting path for %s: %s", name, e)
+        return None
+
+
+def _wait_inotify(dirs, check, deadline):
+    inotify = INotify()
+    try:
+        watch_flags = inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO
+        for directory in dirs:
+            inotify.add_watch(directory, watch_flags)
+        # Re-check after arming the watches so a file landing in between is not missed
+        path = check()
+        while not path:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if inotify.read(timeout=int(remaining * 1000) + 1):
+                path = check()
+        return path
+    finally:
+        inotify.close()
+
+
+def _wait_watchdog(dirs, check, deadline):
+    changed = threading.Event()
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            changed.set()
+
+    observer = Observer()
+    for directory in dirs:
+        observer.schedule(_Handler(), directory, recursive=False)
+    observer.start()
+    try:
+        path = check()
+        while not path:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if changed.wait(remaining):
+                changed.clear()
+                path = check()
+        return path
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def _wait_until(folder_key, dirs, check, timeout, log=None):
+    """Wait until check() is truthy, waking on file events in dirs when a backend is installed"""
+    deadline = time.monotonic() + timeout
+
+    if dirs and (INOTIFY_AVAILABLE or WATCHDOG_AVAILABLE):
+        try:
+            if INOTIFY_AVAILABLE:
+                return _wait_inotify(dirs, check, deadline)
+            return _wait_watchdog(dirs, check, deadline)
+        except OSError as e:
+            # e.g. inotify watch limit reached; poll for whatever time is left
+            if log:
+                log("File watch unavailable for %s, polling instead: %s", folder_key, e)
+
+    result = check()
+    while not result and time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL_SECONDS)
+        result = check()
+    return result
+
+
+def wait_for_model_file(folder_key, name, timeout=5.0, log=None):
+    """
+    Block until a model file becomes resolvable or the timeout expires.
+
+    Uses inotify (inotify_simple) or watchdog when installed so the wait ends
+    as soon as a download is closed or renamed into place, and falls back to
+    short polling otherwise.
+
+    Args:
+        folder_key (str): folder_paths key, e.g. "controlnet"
+        name (str): File name relative to the model folder
+        timeout (float): Maximum seconds to wait
+        log: Optional log_debug-style callable
+
+    Returns:
+        str or None: Full path once the file exists, else None
+    """
+    check = lambda: _lookup(folder_key, name, log)
+    return _wait_until(folder_key, _candidate_dirs(folder_key, name), check, timeout, log)
+
+
+# Added: 2026-10-16 - Resolve several files of one folder with a single shared wait
+def resolve_model_paths(folder_key, names, max_attempts=5, log=None):
+    """
+    Resolve several model file names in one folder, rescanning only on a miss.
+
+    get_full_path checks the configured folders directly, so files that are
+    already on disk resolve without any directory listing. If any are
+    missing (e.g. still being downloaded), one wait covers all of them,
+    the cached list is refreshed once (so the UI sees the new files) and the
+    missing names are resolved once more.
+
+    Args:
+        folder_key (str): folder_paths key, e.g. "text_encoders"
+        names (list): File names relative to the model folder
+        max_attempts (int): Kept for the loaders' messages; the wait lasts
+            max_attempts - 1 seconds, the same budget as the old retry loop
+        log: Optional log_debug-style callable for progress messages
+
+    Returns:
+        list: Full path per name, None for names that never appeared
+    """
+    paths = [_lookup(folder_key, name, log) for name in names]
+    missing = [i for i, path in enumerate(paths) if not path]
+    if not missing:
+        return paths
+
+    if log:
+        log("%s not found in %s, waiting for them to appear", [names[i] for i in missing], folder_key)
+
+    def check():
+        for i in missing:
+            if not paths[i]:
+                paths[i] = _lookup(folder_key, names[i], log)
+        return all(paths)
+
+    dirs = []
+    for i in missing:
+        for directory in _candidate_dirs(folder_key, names[i]):
+            if directory not in dirs:
+                dirs.append(directory)
+
+    # Updated: 2026-10-16 - Event-driven wait instead of fixed one second sleeps
+    _wait_until(folder_key, dirs, check, float(max(max_attempts - 1, 0)), log)
+    refresh_filename_list(folder_key)
+    check()
+    return paths
+
+
+def resolve_model_path(folder_key, name, max_attempts=5, log=None):
+    """
+    Resolve one model file name to its full path; see resolve_model_paths.
+
+    Returns:
+        str or None: Full path, or None if the file never appeared
+    """
+    return resolve_model_paths(folder_key, [name], max_attempts=max_attempts, log=log)[0]
@@ -1,3 +1,32 @@
 """
 Test suite for EmProps ComfyUI nodes
 """
+import os
+import sys
+import types
+import importlib
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# ComfyUI's folder_paths and server modules only exist inside a running ComfyUI
+sys.modules.setdefault('folder_paths', MagicMock())
+sys.modules.setdefault('server', MagicMock())
+
+# Name the node package is loaded under by import_node_module
+_PACKAGE = 'emprops_comfy_nodes'
+
+
+def import_node_module(name):
+    """
+    Import a module of this package (e.g. "nodes.emprops_image_loader") so that its
+    relative imports such as ``..utils`` resolve, without running the package
+    __init__ (which registers every node with ComfyUI).
+    """
+    if _PACKAGE not in sys.modules:
+        package = types.ModuleType(_PACKAGE)
+        package.__path__ = [PROJECT_ROOT]
+        sys.modules[_PACKAGE] = package
+    return importlib.import_module(f"{_PACKAGE}.{name}")
@@ -0,0 +1,109 @@
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+from . import import_node_module
+
+download_helper = import_node_module('nodes.helpers.download_helper')
+download_ranged = download_helper.download_ranged
+
+
+class FakeResponse:
+    def __init__(self, status_code, body, chunk=7):
+        self.status_code = status_code
+        self._body = body
+        self._chunk = chunk
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise IOError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size):
+        step = min(chunk_size, self._chunk)
+        for i in range(0, len(self._body), step):
+            yield self._body[i:i + step]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeRangeSession:
+    """Serves byte ranges of payload; respond can alter the body or status per range"""
+
+    def __init__(self, payload, respond=None):
+        self.payload = payload
+        self.respond = respond
+        self.ranges = []
+        self.headers = []
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        start, end = map(int, re.fullmatch(r"bytes=(\d+)-(\d+)", headers["Range"]).groups())
+        with self._lock:
+            self.ranges.append((start, end))
+            self.headers.append(headers)
+        body = self.payload[start:end + 1]
+        if self.respond:
+            return self.respond(start, end, body)
+        return FakeResponse(206, body)
+
+
+class TestDownloadRanged(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'model.bin')
+        self.payload = os.urandom(1000)
+        self.progress = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _download(self, session, parts=4):
+        download_ranged(session, 'https://example.com/model', {"Authorization": "Bearer t"}, self.path,
+                        len(self.payload), self.progress.append, parts=parts, chunk_size=64)
+
+    def test_parts_are_reassembled_in_place(self):
+        session = FakeRangeSession(self.payload)
+        self._download(session, parts=3)
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), self.payload)
+        self.assertEqual(sorted(session.ranges), [(0, 333), (334, 667), (668, 999)])
+        self.assertEqual(sum(self.progress), len(self.payload))
+        self.assertTrue(all(h["Authorization"] == "Bearer t" for h in session.headers))
+
+    def test_more_parts_than_bytes(self):
+        self.payload = b'abc'
+        self._download(FakeRangeSession(self.payload), parts=8)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b'abc')
+
+    def test_short_range_raises(self):
+        session = FakeRangeSession(self.payload, lambda start, end, body: FakeResponse(206, body[:-1]))
+        with self.assertRaisesRegex(IOError, 'Incomplete range'):
+            self._download(session)
+
+    def test_long_range_raises_before_overwriting_the_next_part(self):
+        session = FakeRangeSession(self.payload, lambda start, end, body: FakeResponse(206, body + b'extra'))
+        with self.assertRaisesRegex(IOError, 'more data than requested'):
+            self._download(session)
+
+    def test_ignored_range_raises(self):
+        session = FakeRangeSession(self.payload, lambda start, end, body: FakeResponse(200, self.payload))
+        with self.assertRaisesRegex(IOError, 'ignored range request'):
+            self._download(session)
+
+    def test_http_error_propagates(self):
+        session = FakeRangeSession(self.payload, lambda start, end, body: FakeResponse(503 if start else 206, body))
+        with self.assertRaisesRegex(IOError, 'HTTP 503'):
+            self._download(session)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+from . import import_node_module
+
+image_loader = import_node_module('nodes.emprops_image_loader')
+folder_paths = image_loader.folder_paths
+
+
+class TestEmpropsImageLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.loader = image_loader.EmpropsImageLoader()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _load(self, path):
+        folder_paths.get_annotated_filepath.return_value = path
+        return self.loader.load_image(source_type='upload', image=os.path.basename(path))
+
+    def test_animated_gif_returns_every_frame(self):
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        frames = [Image.new('RGB', (8, 6), color) for color in colors]
+        path = os.path.join(self.tmpdir, 'anim.gif')
+        frames[0].save(path, save_all=True, append_images=frames[1:], duration=100, loop=0)
+
+        image, mask, _, _ = self._load(path)
+
+        self.assertEqual(tuple(image.shape), (3, 6, 8, 3))
+        self.assertEqual(mask.shape[0], 3)
+        for index, color in enumerate(colors):
+            pixel = [round(float(v) * 255) for v in image[index, 0, 0]]
+            self.assertEqual(pixel, list(color))
+
+    def test_exif_orientation_is_applied(self):
+        img = Image.new('RGB', (8, 6), (10, 20, 30))
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Rotate 90 CW
+        path = os.path.join(self.tmpdir, 'rotated.png')
+        img.save(path, exif=exif)
+
+        image, _, _, _ = self._load(path)
+
+        self.assertEqual(tuple(image.shape), (1, 8, 6, 3))
+
+    def test_alpha_channel_becomes_inverted_mask(self):
+        img = Image.new('RGBA', (4, 4), (0, 0, 0, 0))
+        img.putpixel((0, 0), (0, 0, 0, 255))
+        path = os.path.join(self.tmpdir, 'alpha.png')
+        img.save(path)
+
+        _, mask, _, _ = self._load(path)
+
+        self.assertEqual(tuple(mask.shape), (1, 4, 4))
+        self.assertEqual(float(mask[0, 0, 0]), 0.0)
+        self.assertEqual(float(mask[0, 1, 1]), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
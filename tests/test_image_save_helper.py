@@ -0,0 +1,122 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+
+import numpy as np
+import torch
+from PIL import Image
+
+from . import import_node_module
+
+image_save_helper = import_node_module('nodes.helpers.image_save_helper')
+EncodeStream = image_save_helper.EncodeStream
+ImageSaveHelper = image_save_helper.ImageSaveHelper
+write_file_bytes = image_save_helper.write_file_bytes
+
+
+class TestWriteFileBytes(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'out.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_writes_bytesio_buffer(self):
+        data = io.BytesIO(os.urandom(300_000))
+        write_file_bytes(self.path, data.getbuffer())
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), data.getvalue())
+
+    def test_truncates_existing_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'x' * 100)
+        write_file_bytes(self.path, b'short')
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b'short')
+
+    def test_multibyte_items_are_written_as_raw_bytes(self):
+        data = array('H', [1, 2, 3])
+        write_file_bytes(self.path, data)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), data.tobytes())
+
+
+class TestEncodeStream(unittest.TestCase):
+    def test_reads_everything_the_encoder_writes(self):
+        payload = os.urandom(1_000_000)  # larger than a pipe buffer
+        with EncodeStream(lambda fp: fp.write(payload)) as stream:
+            self.assertEqual(stream.read(), payload)
+
+    def test_chunked_reads_end_with_empty_bytes(self):
+        with EncodeStream(lambda fp: fp.write(b'abcdef')) as stream:
+            chunks = []
+            while chunk := stream.read(4):
+                chunks.append(chunk)
+        self.assertEqual(b''.join(chunks), b'abcdef')
+
+    def test_encoder_error_is_raised_at_eof(self):
+        def encode(fp):
+            fp.write(b'partial')
+            raise ValueError('encode failed')
+
+        with EncodeStream(encode) as stream:
+            self.assertEqual(stream.read(7), b'partial')
+            with self.assertRaisesRegex(ValueError, 'encode failed'):
+                stream.read()
+
+    def test_close_before_eof_does_not_hang(self):
+        def encode(fp):
+            for _ in range(64):
+                fp.write(b'x' * 65536)
+
+        stream = EncodeStream(encode)
+        self.assertEqual(stream.read(10), b'x' * 10)
+        stream.close()
+        self.assertFalse(stream._thread.is_alive())
+        self.assertIsInstance(stream._error, BrokenPipeError)
+
+    def test_not_seekable(self):
+        with EncodeStream(lambda fp: None) as stream:
+            self.assertTrue(stream.readable())
+            self.assertFalse(stream.seekable())
+            self.assertEqual(stream.read(), b'')
+
+
+class TestImageSaveHelper(unittest.TestCase):
+    def setUp(self):
+        self.helper = ImageSaveHelper()
+        self.image = torch.rand((16, 24, 3))
+        self.prompt = {"1": {"class_type": "KSampler"}}
+
+    def test_open_encode_stream_produces_png_with_metadata(self):
+        with self.helper.open_encode_stream(self.image, prompt=self.prompt) as stream:
+            data = stream.read()
+        img = Image.open(io.BytesIO(data))
+        self.assertEqual(img.format, 'PNG')
+        self.assertEqual(img.size, (24, 16))
+        self.assertIn('prompt', img.text)
+        self.assertEqual(img.text['mime_type'], 'image/png')
+
+    def test_encode_matches_uint8_conversion(self):
+        buf = io.BytesIO()
+        self.helper.encode_image(self.image, buf)
+        decoded = np.asarray(Image.open(io.BytesIO(buf.getvalue())))
+        expected = (self.image.clamp(0, 1) * 255).to(torch.uint8).numpy()
+        np.testing.assert_array_equal(decoded, expected)
+
+    @unittest.skipUnless(image_save_helper.PYVIPS_AVAILABLE, "pyvips/libvips not installed")
+    def test_encode_png_pyvips_round_trip(self):
+        arr = self.helper._to_uint8_array(self.image)
+        data = self.helper._encode_png_pyvips(arr, [("prompt", '{"a": 1}'), ("mime_type", "image/png")], 1)
+        img = Image.open(io.BytesIO(data))
+        np.testing.assert_array_equal(np.asarray(img), arr)
+        self.assertEqual(img.text.get('prompt'), '{"a": 1}')
+        self.assertEqual(img.text.get('mime_type'), 'image/png')
+
+
+if __name__ == '__main__':
+    unittest.main()
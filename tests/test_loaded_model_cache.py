@@ -0,0 +1,160 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+from unittest.mock import patch
+
+from . import import_node_module
+
+loaded_model_cache = import_node_module('nodes.helpers.loaded_model_cache')
+LoadedModelCache = loaded_model_cache.LoadedModelCache
+
+
+class TestLoadedModelCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.free_ram = None
+        self.cache = LoadedModelCache(max_size=2, min_free_ram=100, free_ram=lambda: self.free_ram)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _model_file(self, name, content=b'weights'):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_hit_returns_same_object_without_loading(self):
+        path = self._model_file('a.safetensors')
+        first = self.cache.get_or_load('checkpoint', [path], {}, object)
+        second = self.cache.get_or_load('checkpoint', [path], {}, lambda: self.fail('reloaded'))
+        self.assertIs(first, second)
+
+    def test_options_and_kind_are_part_of_the_key(self):
+        path = self._model_file('a.safetensors')
+        a = self.cache.get_or_load('checkpoint', [path], {'dtype': 'fp16'}, object)
+        b = self.cache.get_or_load('checkpoint', [path], {'dtype': 'fp8'}, object)
+        c = self.cache.get_or_load('vae', [path], {'dtype': 'fp16'}, object)
+        self.assertEqual(len({id(a), id(b), id(c)}), 3)
+
+    def test_replaced_file_is_reloaded(self):
+        path = self._model_file('a.safetensors')
+        first = self.cache.get_or_load('checkpoint', [path], {}, object)
+        self._model_file('a.safetensors', b'new weights, different size')
+        second = self.cache.get_or_load('checkpoint', [path], {}, object)
+        self.assertIsNot(first, second)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        a, b, c = (self._model_file(n) for n in ('a', 'b', 'c'))
+        obj_a = self.cache.get_or_load('m', [a], {}, object)
+        self.cache.get_or_load('m', [b], {}, object)
+        self.cache.get_or_load('m', [a], {}, object)  # a becomes most recent
+        self.cache.get_or_load('m', [c], {}, object)  # evicts b
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIs(self.cache.get_or_load('m', [a], {}, lambda: self.fail('a evicted')), obj_a)
+        loads = []
+        self.cache.get_or_load('m', [b], {}, lambda: loads.append(1) or object())
+        self.assertEqual(loads, [1])
+
+    def test_zero_size_disables_caching(self):
+        cache = LoadedModelCache(max_size=0, min_free_ram=0, free_ram=lambda: None)
+        path = self._model_file('a')
+        self.assertIsNot(cache.get_or_load('m', [path], {}, object), cache.get_or_load('m', [path], {}, object))
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_misses_load_once(self):
+        path = self._model_file('a')
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get_or_load('m', [path], {}, load))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+        self.assertEqual(self.cache._loading, {})
+
+    def test_failed_load_is_not_cached(self):
+        path = self._model_file('a')
+
+        def fail():
+            raise RuntimeError('corrupt')
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_load('m', [path], {}, fail)
+        self.assertEqual(len(self.cache), 0)
+        self.assertIsNotNone(self.cache.get_or_load('m', [path], {}, object))
+
+    def test_none_result_is_not_cached(self):
+        path = self._model_file('a')
+        self.assertIsNone(self.cache.get_or_load('m', [path], {}, lambda: None))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache._loading, {})
+        self.assertIsNotNone(self.cache.get_or_load('m', [path], {}, object))
+
+    def test_low_ram_evicts_oldest_first(self):
+        a, b = self._model_file('a'), self._model_file('b')
+        self.cache.get_or_load('m', [a], {}, object)
+        self.cache.get_or_load('m', [b], {}, object)
+
+        readings = iter([50, 200])  # below the limit once, then recovered
+        self.cache._free_ram = lambda: next(readings)
+        self.assertEqual(self.cache.ensure_headroom(), 1)
+        self.assertEqual(len(self.cache), 1)
+        self.cache.get_or_load('m', [b], {}, lambda: self.fail('b evicted'))
+
+    def test_unmeasurable_ram_keeps_entries(self):
+        self.cache.get_or_load('m', [self._model_file('a')], {}, object)
+        self.assertEqual(self.cache.ensure_headroom(), 0)
+        self.assertEqual(len(self.cache), 1)
+
+
+class TestComfyMemoryHooks(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        model_management = types.ModuleType('comfy.model_management')
+        model_management.unload_all_models = lambda: self.calls.append('unload')
+        model_management.free_memory = lambda *args, **kwargs: self.calls.append(('free', args, kwargs))
+        comfy = types.ModuleType('comfy')
+        comfy.model_management = model_management
+        patcher = patch.dict(sys.modules, {'comfy': comfy, 'comfy.model_management': model_management})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.model_management = model_management
+
+    def test_unload_clears_cache_and_free_memory_checks_headroom(self):
+        cache = LoadedModelCache(max_size=2, min_free_ram=0, free_ram=lambda: None)
+        tmp = tempfile.NamedTemporaryFile(delete=False)
+        tmp.close()
+        self.addCleanup(os.remove, tmp.name)
+        cache.get_or_load('m', [tmp.name], {}, object)
+
+        self.assertTrue(loaded_model_cache.install_comfy_memory_hooks(cache))
+        self.assertTrue(loaded_model_cache.install_comfy_memory_hooks(cache))  # idempotent
+
+        with patch.object(cache, 'ensure_headroom') as ensure_headroom:
+            self.model_management.free_memory(1024, 'cpu', keep_loaded=[])
+            ensure_headroom.assert_called_once_with()
+        self.assertEqual(self.calls, [('free', (1024, 'cpu'), {'keep_loaded': []})])
+
+        self.model_management.unload_all_models()
+        self.assertEqual(self.calls[-1], 'unload')
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from . import import_node_module
+
+model_path_helper = import_node_module('nodes.helpers.model_path_helper')
+
+
+def _write_later(path, delay):
+    def write():
+        time.sleep(delay)
+        with open(path, 'wb') as f:
+            f.write(b'weights')
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+class TestResolveModelPaths(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        folder_paths = MagicMock()
+        folder_paths.filename_list_cache = {}
+        folder_paths.get_folder_paths.return_value = [self.tmpdir]
+
+        def get_full_path(folder_key, name):
+            path = os.path.join(self.tmpdir, name)
+            return path if os.path.isfile(path) else None
+        folder_paths.get_full_path.side_effect = get_full_path
+
+        patcher = patch.object(model_path_helper, 'folder_paths', folder_paths)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.folder_paths = folder_paths
+        model_path_helper._last_refresh_ts.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _touch(self, name):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as f:
+            f.write(b'weights')
+        return path
+
+    def test_existing_files_resolve_without_rescan(self):
+        a = self._touch('a.safetensors')
+        b = self._touch('b.safetensors')
+
+        paths = model_path_helper.resolve_model_paths('checkpoints', ['a.safetensors', 'b.safetensors'])
+
+        self.assertEqual(paths, [a, b])
+        self.folder_paths.get_filename_list.assert_not_called()
+
+    def test_waits_for_file_being_written(self):
+        expected = os.path.join(self.tmpdir, 'late.safetensors')
+        writer = _write_later(expected, 0.3)
+        start = time.monotonic()
+
+        path = model_path_helper.resolve_model_path('loras', 'late.safetensors', max_attempts=5)
+
+        writer.join()
+        self.assertEqual(path, expected)
+        self.assertLess(time.monotonic() - start, 3.0)
+        self.folder_paths.get_filename_list.assert_called_once_with('loras')
+
+    def test_polling_fallback_without_event_backends(self):
+        expected = os.path.join(self.tmpdir, 'polled.safetensors')
+        writer = _write_later(expected, 0.3)
+
+        with patch.object(model_path_helper, 'INOTIFY_AVAILABLE', False), \
+                patch.object(model_path_helper, 'WATCHDOG_AVAILABLE', False):
+            path = model_path_helper.resolve_model_path('loras', 'polled.safetensors', max_attempts=5)
+
+        writer.join()
+        self.assertEqual(path, expected)
+
+    def test_missing_file_times_out(self):
+        present = self._touch('present.safetensors')
+        start = time.monotonic()
+
+        paths = model_path_helper.resolve_model_paths('vae', ['present.safetensors', 'missing.safetensors'], max_attempts=2)
+
+        self.assertEqual(paths, [present, None])
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+        self.folder_paths.get_filename_list.assert_called_once_with('vae')
+
+    def test_lookup_errors_count_as_missing(self):
+        self.folder_paths.get_full_path.side_effect = RuntimeError('bad folder')
+
+        paths = model_path_helper.resolve_model_paths('vae', ['x.safetensors'], max_attempts=1)
+
+        self.assertEqual(paths, [None])
+
+
+class TestRefreshFilenameList(unittest.TestCase):
+    def setUp(self):
+        folder_paths = MagicMock()
+        folder_paths.filename_list_cache = {'loras': object(), 'vae': object()}
+        patcher = patch.object(model_path_helper, 'folder_paths', folder_paths)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.folder_paths = folder_paths
+        model_path_helper._last_refresh_ts.clear()
+
+    def test_only_the_requested_folder_is_invalidated(self):
+        self.assertTrue(model_path_helper.refresh_filename_list('loras'))
+        self.assertNotIn('loras', self.folder_paths.filename_list_cache)
+        self.assertIn('vae', self.folder_paths.filename_list_cache)
+        self.folder_paths.get_filename_list.assert_called_once_with('loras')
+
+    def test_recent_rescan_is_reused_unless_forced(self):
+        self.assertTrue(model_path_helper.refresh_filename_list('loras'))
+        self.assertFalse(model_path_helper.refresh_filename_list('loras'))
+        self.assertTrue(model_path_helper.refresh_filename_list('loras', force=True))
+        self.assertEqual(self.folder_paths.get_filename_list.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,9 @@
 import base64
+import functools
 import os
 import urllib.parse
 import requests  # type: ignore # Will be fixed with types-requests
 import folder_paths  # type: ignore # Custom module without stubs
-import boto3  # type: ignore # Will be fixed with types-boto3
 from typing import Optional, Tuple, List, Any, Dict, Union
 from dotenv import load_dotenv
 import piexif  # type: ignore # No stubs available
@@ -22,6 +22,17 @@ except ImportError:
     GCS_AVAILABLE = False
     print("[EmProps] Google Cloud Storage not available. Install with 'pip install google-cloud-storage'")
 
+# Added: 2026-10-16 - Concurrent ranged GCS downloads (google-cloud-storage 2.7+)
+try:
+    from google.cloud.storage import transfer_manager  # type: ignore # No stubs available
+    GCS_TRANSFER_MANAGER_AVAILABLE = True
+except ImportError:
+    GCS_TRANSFER_MANAGER_AVAILABLE = False
+
+# Added: 2026-10-16 - Objects above this size are downloaded as parallel ranged chunks
+_PARALLEL_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+_PARALLEL_DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
 # Import Azure Blob Storage client library
 # Added: 2025-04-13T21:28:00-04:00 - Azure Blob Storage support
 try:
@@ -31,6 +42,131 @@ except ImportError:
     AZURE_AVAILABLE = False
     print("[EmProps] Azure Blob Storage not available. Install with 'pip install azure-storage-blob'")
 
+# Added: 2026-10-16 - Defer the boto3 import (botocore, urllib3, ...) until AWS is first used
+_boto3 = None
+
+def get_boto3():
+    """
+    Import boto3 on first use and return the module.
+
+    Returns:
+        module: The boto3 module
+    """
+    global _boto3
+    if _boto3 is None:
+        import boto3  # type: ignore # Will be fixed with types-boto3
+        _boto3 = boto3
+    return _boto3
+
+# Added: 2026-10-16 - Shared multipart transfer settings for S3 uploads/downloads
+@functools.lru_cache(maxsize=None)
+def get_s3_transfer_config(max_concurrency: int = 10, chunk_size: int = 8 * 1024 * 1024):
+    """
+    Build (once per setting) a boto3 TransferConfig for parallel multipart transfers.
+
+    Args:
+        max_concurrency: Number of parts transferred in parallel
+        chunk_size: Multipart threshold and part size in bytes
+
+    Returns:
+        TransferConfig: Config to pass as Config= to upload_fileobj/download_file
+    """
+    get_boto3()
+    from boto3.s3.transfer import TransferConfig  # type: ignore
+    return TransferConfig(
+        multipart_threshold=chunk_size,
+        multipart_chunksize=chunk_size,
+        max_concurrency=max_concurrency,
+        use_threads=True
+    )
+
+# Added: 2026-10-16 - Connection pool sized for the multipart transfer threads (botocore's
+# default of 10 makes 16-way transfers queue for sockets), adaptive retries and TCP keepalive
+@functools.lru_cache(maxsize=None)
+def get_s3_client_config():
+    """
+    Build (once per process) the botocore Config used for every S3 client.
+
+    Returns:
+        botocore.config.Config: Client config to pass as config= to boto3 client()
+    """
+    get_boto3()
+    from botocore.config import Config  # type: ignore
+    try:
+        return Config(max_pool_connections=32, retries={"mode": "adaptive"}, tcp_keepalive=True)
+    except TypeError:
+        # tcp_keepalive needs botocore 1.27+
+        return Config(max_pool_connections=32, retries={"mode": "adaptive"})
+
+# Added: 2026-10-16 - One S3 client per access key and region; boto3 clients are thread-safe and
+# keep their connection pool, so repeat node runs skip credential resolution and TLS setup
+def _aws_secret_from_env() -> Optional[str]:
+    """AWS secret key from the environment (.env files are loaded into it by the callers)"""
+    return os.getenv('AWS_SECRET_ACCESS_KEY') or _process_secret_key(os.getenv('AWS_SECRET_ACCESS_KEY_ENCODED', '')) or None
+
+# Updated: 2026-10-16 - Keyed by access key id and region only; the secret is read here and never
+# becomes part of the cache key
+@functools.lru_cache(maxsize=8)
+def get_s3_client(aws_access_key_id: Optional[str], region_name: Optional[str]):
+    """
+    Shared boto3 S3 client for an access key id and region.
+
+    Args:
+        aws_access_key_id: AWS access key ID
+        region_name: AWS region
+
+    Returns:
+        S3.Client: Pooled S3 client
+    """
+    return get_boto3().client(
+        's3',
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=_aws_secret_from_env(),
+        region_name=region_name,
+        config=get_s3_client_config()
+    )
+
+# Added: 2026-10-16 - Reserve a download's full size up front so parallel chunk writes land in
+# contiguous blocks instead of growing a sparse file
+def preallocate_file(fileobj, size: int) -> None:
+    """
+    Best-effort posix_fallocate of size bytes for an open, writable file.
+
+    Args:
+        fileobj: File object opened for writing
+        size: Expected final size in bytes
+    """
+    if size <= 0 or not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(fileobj.fileno(), 0, size)
+    except OSError:
+        pass
+
+# Added: 2026-10-16 - Timeout (seconds) for the savers' CDN availability HEAD
+CDN_PROBE_TIMEOUT = 10
+
+# Added: 2026-10-16 - Pooled HTTP session for repeated requests to the same host (e.g. CDN checks)
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """
+    Build (once per process) a requests.Session with a keep-alive pool and light retries.
+
+    Returns:
+        requests.Session: Shared session; safe for the simple HEAD/GET calls made by the nodes
+    """
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.5)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 def unescape_env_value(encoded_value):
     """
     Unescapes a base64 encoded environment variable value.
@@ -348,12 +484,8 @@ class S3Handler:
             if not secret_key: missing.append('AWS_SECRET_ACCESS_KEY')
             raise ValueError(f"Missing required AWS environment variables: {', '.join(missing)}")
         
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region
-        )
+        # Updated: 2026-10-16 - Shared, pooled client
+        self.s3_client = get_s3_client(access_key, region)
 
     def verify_s3_upload(self, bucket: str, key: str, max_attempts: int = 5, delay: float = 1) -> bool:
         """Verify that a file exists in S3 by checking with head_object"""
@@ -465,15 +597,36 @@ class S3Handler:
         try:
             s3_url = f"s3://{self.bucket_name}/{s3_key}"
             print(f"[EmProps] Downloading from: {s3_url}")
+            # Updated: 2026-10-16 - Ranged parallel GETs for large objects (16 x 16 MB parts)
             self.s3_client.download_file(
                 Bucket=self.bucket_name,
                 Key=s3_key,
-                Filename=local_path
+                Filename=local_path,
+                Config=get_s3_transfer_config(max_concurrency=16, chunk_size=16 * 1024 * 1024)
             )
             return True, ""
         except Exception as e:
             return False, str(e)
 
+    # Added: 2026-10-16 - In-memory download for callers that decode the object directly
+    def download_bytes(self, s3_key: str) -> Tuple[Optional[bytes], str]:
+        """
+        Download an object from the S3 bucket into memory
+        
+        Args:
+            s3_key: S3 object key
+            
+        Returns:
+            Tuple[Optional[bytes], str]: (data, error_message); data is None on failure
+        """
+        try:
+            s3_url = f"s3://{self.bucket_name}/{s3_key}"
+            print(f"[EmProps] Downloading from: {s3_url}")
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+            return response['Body'].read(), ""
+        except Exception as e:
+            return None, str(e)
+
     def list_files(self, prefix: Optional[str] = None) -> List[str]:
         """
         List files in S3 bucket with optional prefix
@@ -564,13 +717,35 @@ class GCSHandler:
             print(f"[EmProps] Error checking GCS object: {str(e)}")
             return False
 
-    def download_file(self, gcs_key: str, local_path: str) -> Tuple[bool, str]:
+    # Added: 2026-10-16 - Upload from an in-memory stream using chunked resumable uploads
+    def upload_from_fileobj(self, fileobj, gcs_key: str, content_type: Optional[str] = None, chunk_size: int = 8 * 1024 * 1024) -> None:
+        """
+        Upload a file-like object to the GCS bucket
+        
+        Args:
+            fileobj: Readable file-like object, uploaded from its start
+            gcs_key: GCS object key
+            content_type: Optional MIME type for the object
+            chunk_size: Resumable upload chunk size (multiple of 256 KB)
+            
+        Raises:
+            ValueError: If the GCS client is not initialized
+        """
+        if not self.gcs_client:
+            raise ValueError("GCS client not initialized")
+        
+        bucket = self.gcs_client.bucket(self.bucket_name)
+        blob = bucket.blob(gcs_key, chunk_size=chunk_size)
+        blob.upload_from_file(fileobj, content_type=content_type, rewind=True)
+
+    def download_file(self, gcs_key: str, local_path: str, size: Optional[int] = None) -> Tuple[bool, str]:
         """
         Download a file from GCS bucket
         
         Args:
             gcs_key: GCS object key
             local_path: Local path to save the file
+            size: Object size in bytes if the caller already knows it (skips a metadata request)
             
         Returns:
             Tuple[bool, str]: (success, error_message)
@@ -587,12 +762,49 @@ class GCSHandler:
             
             bucket = self.gcs_client.bucket(self.bucket_name)
             blob = bucket.blob(gcs_key)
-            blob.download_to_filename(local_path)
+            # Updated: 2026-10-16 - Large objects are fetched as concurrent ranged chunks when the
+            # installed google-cloud-storage has transfer_manager (2.7+)
+            # Fixed: 2026-10-16 - Metadata is only fetched when the size is unknown and chunking is
+            # possible, and chunks run in threads (the default worker type forks the server process)
+            if GCS_TRANSFER_MANAGER_AVAILABLE and size is None:
+                blob.reload()
+                size = blob.size
+            if GCS_TRANSFER_MANAGER_AVAILABLE and (size or 0) > _PARALLEL_DOWNLOAD_THRESHOLD:
+                transfer_manager.download_chunks_concurrently(
+                    blob, local_path, chunk_size=_PARALLEL_DOWNLOAD_CHUNK_SIZE, max_workers=8,
+                    worker_type=transfer_manager.THREAD
+                )
+            else:
+                blob.download_to_filename(local_path)
             
             return True, ""
         except Exception as e:
             return False, str(e)
 
+    # Added: 2026-10-16 - In-memory download for callers that decode the object directly
+    def download_bytes(self, gcs_key: str) -> Tuple[Optional[bytes], str]:
+        """
+        Download an object from the GCS bucket into memory
+        
+        Args:
+            gcs_key: GCS object key
+            
+        Returns:
+            Tuple[Optional[bytes], str]: (data, error_message); data is None on failure
+        """
+        try:
+            if not self.gcs_client:
+                return None, "GCS client not initialized"
+                
+            gcs_url = f"gs://{self.bucket_name}/{gcs_key}"
+            print(f"[EmProps] Downloading from: {gcs_url}")
+            
+            bucket = self.gcs_client.bucket(self.bucket_name)
+            blob = bucket.blob(gcs_key)
+            return blob.download_as_bytes(), ""
+        except Exception as e:
+            return None, str(e)
+
     def list_files(self, prefix: Optional[str] = None) -> List[str]:
         """
         List files in GCS bucket with optional prefix
@@ -617,7 +829,9 @@ class GCSHandler:
 
 # Added: 2025-04-13T21:30:00-04:00 - Azure Blob Storage handler implementation
 class AzureHandler:
-    def __init__(self, container_name: Optional[str] = None):
+    # Updated: 2026-10-16 - create_container=False for read-only use (e.g. probing for a model),
+    # so looking up a missing container never creates it
+    def __init__(self, container_name: Optional[str] = None, create_container: bool = True):
         # Updated: 2025-05-07T16:05:00-04:00 - Explicitly load environment variables from .env files
         # Use provided container name or check environment variables
         if container_name:
@@ -691,6 +905,8 @@ class AzureHandler:
         self.container_client = self.blob_service_client.get_container_client(self.container_name)
         
         # Create container if it doesn't exist
+        if not create_container:
+            return
         try:
             container_properties = self.container_client.get_container_properties()
             print(f"[EmProps] Using existing Azure container: {self.container_name}")
@@ -741,13 +957,34 @@ class AzureHandler:
                 return False, f"Blob not found: {blob_name}"
             
             # Download the blob
+            # Updated: 2026-10-16 - Stream into a preallocated file with parallel range requests
+            # instead of buffering the whole blob in memory
+            downloader = blob_client.download_blob(max_concurrency=16)
             with open(local_path, "wb") as download_file:
-                download_file.write(blob_client.download_blob().readall())
+                preallocate_file(download_file, downloader.size)
+                downloader.readinto(download_file)
             
             return True, ""
         except Exception as e:
             return False, str(e)
     
+    # Added: 2026-10-16 - In-memory download for callers that decode the blob directly
+    def download_bytes(self, blob_name: str) -> Tuple[Optional[bytes], str]:
+        """
+        Download a blob from Azure Blob Storage into memory
+        
+        Args:
+            blob_name: Azure blob name
+            
+        Returns:
+            Tuple[Optional[bytes], str]: (data, error_message); data is None on failure
+        """
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            return blob_client.download_blob().readall(), ""
+        except Exception as e:
+            return None, str(e)
+    
     def upload_file(self, file_path: str, blob_prefix: Optional[str] = None, index: Optional[int] = None, target_name: Optional[str] = None) -> Tuple[bool, str]:
         """
         Upload a file to Azure Blob Storage
@@ -823,6 +1060,29 @@ class AzureHandler:
             print(f"[EmProps] Error listing Azure blobs: {str(e)}")
             return []
 
+# Added: 2026-10-16 - Process-wide handlers per bucket/container. Building one resolves
+# credentials and creates the SDK client (Azure also probes the container), which the
+# download paths otherwise repeated on every call. Failed constructions are not cached
+@functools.lru_cache(maxsize=16)
+def get_s3_handler(bucket_name: Optional[str] = None) -> "S3Handler":
+    """Shared S3Handler for a bucket; boto3 clients are safe to share across threads"""
+    return S3Handler(bucket_name)
+
+@functools.lru_cache(maxsize=16)
+def get_gcs_handler(bucket_name: Optional[str] = None) -> "GCSHandler":
+    """Shared GCSHandler for a bucket; raises ValueError (not cached) if the client cannot be created"""
+    handler = GCSHandler(bucket_name)
+    # Fixed: 2026-10-16 - GCSHandler swallows credential errors and leaves gcs_client as None;
+    # raising keeps that broken handler out of the cache so the next call retries
+    if not handler.gcs_client:
+        raise ValueError("Failed to initialize Google Cloud Storage client. Check your credentials.")
+    return handler
+
+@functools.lru_cache(maxsize=16)
+def get_azure_handler(container_name: Optional[str] = None, create_container: bool = True) -> "AzureHandler":
+    """Shared AzureHandler for a container; pass create_container=False for read-only use"""
+    return AzureHandler(container_name, create_container=create_container)
+
 # Initialize mimetypes with common image formats
 mimetypes.init()
 mimetypes.add_type('image/jpeg', '.jpg')